@@ -0,0 +1,43 @@
+"""Shared API exceptions with machine-readable error codes."""
+
+import enum
+
+from fastapi import HTTPException, Request
+from fastapi.responses import JSONResponse
+
+
+class ErrorCode(str, enum.Enum):
+    """Stable error codes returned alongside the human-readable detail."""
+
+    NO_ACTIVE_SOURCES = "NO_ACTIVE_SOURCES"
+    NO_ACTIVE_DELIVERIES = "NO_ACTIVE_DELIVERIES"
+
+
+class APIError(HTTPException):
+    """HTTPException that also carries a stable error code.
+
+    Clients can branch on ``error_code`` instead of matching on the
+    ``detail`` message, which is free to change.
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        error_code: ErrorCode,
+        detail: str,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        super().__init__(status_code=status_code, detail=detail, headers=headers)
+        self.error_code = error_code
+
+
+async def api_error_handler(request: Request, exc: Exception) -> JSONResponse:
+    """Render an APIError as ``{"detail": ..., "error_code": ...}``."""
+    # Only registered for APIError; Starlette types handlers with Exception
+    if not isinstance(exc, APIError):
+        raise exc
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={"detail": exc.detail, "error_code": exc.error_code.value},
+        headers=exc.headers,
+    )
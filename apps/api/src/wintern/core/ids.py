@@ -0,0 +1,49 @@
+"""Primary key generation - time-ordered UUIDs."""
+
+import secrets
+import time
+import uuid
+
+# Largest value of the 12-bit rand_a field, used here as a sequence counter
+_MAX_COUNTER = 0xFFF
+
+_last_timestamp_ms = 0
+_counter = 0
+
+
+def new_id() -> uuid.UUID:
+    """Generate a UUIDv7 (RFC 9562) for use as a primary key.
+
+    The leading 48 bits are a millisecond Unix timestamp, so new rows land at
+    the end of the primary key index instead of at random pages. Within the
+    same millisecond the 12-bit rand_a field acts as a counter, keeping ids
+    from one process strictly increasing.
+
+    Returns:
+        A new version 7 UUID.
+    """
+    global _last_timestamp_ms, _counter
+
+    timestamp_ms = time.time_ns() // 1_000_000
+    if timestamp_ms > _last_timestamp_ms:
+        # Start each millisecond at a random counter below the midpoint,
+        # leaving room to increment
+        _counter = secrets.randbits(11)
+    else:
+        # Same millisecond (or the clock went back): keep ordering by
+        # counting on from the last id, spilling into the next millisecond
+        timestamp_ms = _last_timestamp_ms
+        _counter += 1
+        if _counter > _MAX_COUNTER:
+            timestamp_ms += 1
+            _counter = 0
+    _last_timestamp_ms = timestamp_ms
+
+    value = (
+        (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76  # version
+        | _counter << 64
+        | 0b10 << 62  # variant
+        | secrets.randbits(62)
+    )
+    return uuid.UUID(int=value)
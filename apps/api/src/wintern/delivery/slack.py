@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import logging
+import re
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Any
 
 from slack_sdk.errors import SlackApiError
@@ -19,6 +21,27 @@ logger = logging.getLogger(__name__)
 # Maximum number of items to include in a Slack message (Slack has block limits)
 MAX_ITEMS_PER_MESSAGE = 10
 
+# Maximum length of an item's key excerpt before it is truncated
+MAX_EXCERPT_LENGTH = 200
+
+# Score indicator indexed by relevance_score (0-100): green 80+, yellow 60-79, red below.
+# Scores are clamped before indexing, since items built with model_construct skip
+# the 0-100 validation.
+_SCORE_EMOJI = tuple("🟢" if s >= 80 else "🟡" if s >= 60 else "🔴" for s in range(101))
+
+# Item text: numbered link, score indicator, then reasoning in italics
+_ITEM_TEMPLATE = "*{index}. <{url}|{title}>* {emoji}\n_{reasoning}_"
+
+# Characters that break mrkdwn link display text, and their replacements.
+# translate() maps each character once, so & is never double-escaped.
+# Pipe becomes Unicode DIVIDES (U+2223), which looks similar but won't break mrkdwn.
+_MRKDWN_TEXT_SPECIALS = re.compile(r"[&<>|]")
+_MRKDWN_TEXT_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", "|": "\u2223"})
+
+# Characters that break mrkdwn link URLs, URL-encoded
+_MRKDWN_URL_SPECIALS = re.compile(r"[|>]")
+_MRKDWN_URL_ESCAPES = str.maketrans({"|": "%7C", ">": "%3E"})
+
 
 class SlackError(Exception):
     """Base exception for Slack errors."""
@@ -51,11 +74,13 @@ class SlackRateLimitError(SlackError):
         super().__init__(message)
 
 
+@lru_cache(maxsize=4096)
 def _escape_mrkdwn_text(text: str) -> str:
     """Escape special characters for Slack mrkdwn link display text.
 
     Slack mrkdwn links use the format <url|text>, so we need to escape
     characters that would break this syntax in the display text portion.
+    Results are cached, since titles repeat across re-sends and channels.
 
     Args:
         text: The display text to escape.
@@ -63,17 +88,19 @@ def _escape_mrkdwn_text(text: str) -> str:
     Returns:
         Escaped text safe for use in mrkdwn link display text.
     """
-    # Escape & first (so we don't double-escape), then < > |
-    # Use Unicode DIVIDES (U+2223) to replace pipe - looks similar but won't break mrkdwn
-    result = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-    return result.replace("|", "\u2223")
+    # Most titles have nothing to escape; return them without copying
+    if _MRKDWN_TEXT_SPECIALS.search(text) is None:
+        return text
+    return text.translate(_MRKDWN_TEXT_ESCAPES)
 
 
+@lru_cache(maxsize=4096)
 def _escape_mrkdwn_url(url: str) -> str:
     """Escape special characters in URLs for Slack mrkdwn links.
 
     Slack mrkdwn links use the format <url|text>. URLs containing | or >
     can break the link syntax, so we need to URL-encode these characters.
+    Results are cached, since URLs repeat across re-sends and channels.
 
     Args:
         url: The URL to escape.
@@ -81,9 +108,10 @@ def _escape_mrkdwn_url(url: str) -> str:
     Returns:
         Escaped URL safe for use in mrkdwn links.
     """
-    # URL-encode characters that would break mrkdwn link syntax
-    # | becomes %7C, > becomes %3E
-    return url.replace("|", "%7C").replace(">", "%3E")
+    # Most URLs have nothing to escape; return them without copying
+    if _MRKDWN_URL_SPECIALS.search(url) is None:
+        return url
+    return url.translate(_MRKDWN_URL_ESCAPES)
 
 
 def _format_item_block(item: DeliveryItem, index: int) -> dict[str, Any]:
@@ -96,36 +124,33 @@ def _format_item_block(item: DeliveryItem, index: int) -> dict[str, Any]:
     Returns:
         A Slack Block Kit section block.
     """
-    # Build the item text with score indicator
-    if item.relevance_score >= 80:
-        score_emoji = "🟢"
-    elif item.relevance_score >= 60:
-        score_emoji = "🟡"
-    else:
-        score_emoji = "🔴"
     # Escape URL and title for mrkdwn link syntax
-    safe_url = _escape_mrkdwn_url(item.url)
-    safe_title = _escape_mrkdwn_text(item.title)
-    text_parts = [f"*{index}. <{safe_url}|{safe_title}>* {score_emoji}"]
-    text_parts.append(f"_{item.reasoning}_")
+    text = _ITEM_TEMPLATE.format(
+        index=index,
+        url=_escape_mrkdwn_url(item.url),
+        title=_escape_mrkdwn_text(item.title),
+        emoji=_SCORE_EMOJI[min(max(item.relevance_score, 0), 100)],
+        reasoning=item.reasoning,
+    )
 
     if item.key_excerpt:
         # Truncate excerpt if too long
-        if len(item.key_excerpt) > 200:
-            excerpt = item.key_excerpt[:200] + "..."
-        else:
-            excerpt = item.key_excerpt
-        text_parts.append(f"> {excerpt}")
+        excerpt = item.key_excerpt
+        if len(excerpt) > MAX_EXCERPT_LENGTH:
+            excerpt = excerpt[:MAX_EXCERPT_LENGTH] + "..."
+        text += f"\n> {excerpt}"
 
     return {
         "type": "section",
-        "text": {
-            "type": "mrkdwn",
-            "text": "\n".join(text_parts),
-        },
+        "text": {"type": "mrkdwn", "text": text},
     }
 
 
+def _context_block(text: str) -> dict[str, Any]:
+    """Build a Slack Block Kit context block holding one mrkdwn element."""
+    return {"type": "context", "elements": [{"type": "mrkdwn", "text": text}]}
+
+
 def _build_blocks(payload: DeliveryPayload) -> list[dict[str, Any]]:
     """Build Slack Block Kit blocks from a delivery payload.
 
@@ -135,59 +160,34 @@ def _build_blocks(payload: DeliveryPayload) -> list[dict[str, Any]]:
     Returns:
         A list of Slack Block Kit blocks.
     """
-    blocks: list[dict[str, Any]] = [
+    items = payload.items[:MAX_ITEMS_PER_MESSAGE]
+    overflow = len(payload.items) - MAX_ITEMS_PER_MESSAGE
+    generated_at = datetime.now(UTC).strftime("%Y-%m-%d %H:%M UTC")
+
+    return [
         # Header
         {
             "type": "header",
             "text": {"type": "plain_text", "text": payload.subject[:150], "emoji": True},
         },
         {"type": "divider"},
+        # Body section if present
+        *(
+            (
+                {"type": "section", "text": {"type": "mrkdwn", "text": payload.body[:3000]}},
+                {"type": "divider"},
+            )
+            if payload.body
+            else ()
+        ),
+        # Items (limited to MAX_ITEMS_PER_MESSAGE)
+        *(_format_item_block(item, i) for i, item in enumerate(items, 1)),
+        # Footer if items were truncated
+        *((_context_block(f"_...and {overflow} more items_"),) if overflow > 0 else ()),
+        # Timestamp footer
+        _context_block(f"📅 Generated at {generated_at}"),
     ]
 
-    # Body section if present
-    if payload.body:
-        blocks.append(
-            {
-                "type": "section",
-                "text": {"type": "mrkdwn", "text": payload.body[:3000]},
-            }
-        )
-        blocks.append({"type": "divider"})
-
-    # Add items (limit to MAX_ITEMS_PER_MESSAGE)
-    items_to_show = payload.items[:MAX_ITEMS_PER_MESSAGE]
-    for i, item in enumerate(items_to_show, 1):
-        blocks.append(_format_item_block(item, i))
-
-    # Add footer if items were truncated
-    if len(payload.items) > MAX_ITEMS_PER_MESSAGE:
-        blocks.append(
-            {
-                "type": "context",
-                "elements": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"_...and {len(payload.items) - MAX_ITEMS_PER_MESSAGE} more items_",
-                    }
-                ],
-            }
-        )
-
-    # Timestamp footer
-    blocks.append(
-        {
-            "type": "context",
-            "elements": [
-                {
-                    "type": "mrkdwn",
-                    "text": f"📅 Generated at {datetime.now(UTC).strftime('%Y-%m-%d %H:%M UTC')}",
-                }
-            ],
-        }
-    )
-
-    return blocks
-
 
 async def send_slack(
     webhook_url: str,
@@ -99,7 +99,8 @@ def scored_item_to_delivery_item(item: ScoredItem) -> DeliveryItem:
     Returns:
         A DeliveryItem ready for the delivery payload.
     """
-    return DeliveryItem(
+    # ScoredItem already enforces the same field constraints, so skip re-validating
+    return DeliveryItem.model_construct(
         url=item.url,
         title=item.title,
         relevance_score=item.relevance_score,
@@ -152,6 +153,8 @@ def search_result_to_scraped_item(result: SearchResult) -> ScrapedItem:
 async def execute_wintern(
     session: AsyncSession,
     wintern_id: uuid.UUID,
+    *,
+    advance_schedule: bool = True,
 ) -> uuid.UUID:
     """Execute a wintern through the full pipeline.
 
@@ -170,6 +173,9 @@ async def execute_wintern(
     Args:
         session: The database session.
         wintern_id: The ID of the wintern to execute.
+        advance_schedule: Whether to update next_run_at when the run ends.
+            The scheduler passes False, since claiming the run already
+            advanced it.
 
     Returns:
         The UUID of the created WinternRun.
@@ -274,7 +280,8 @@ async def execute_wintern(
                 source_errors=metadata["source_errors"],
             )
             await execution_service.fail_run(session, run, error_msg, metadata=metadata)
-            await execution_service.update_next_run_at(session, wintern)
+            if advance_schedule:
+                await execution_service.update_next_run_at(session, wintern)
             raise ExecutionError(error_msg)
 
         # Step 3: Deduplicate against SeenContent
@@ -304,7 +311,8 @@ async def execute_wintern(
                 digest_content="No new content found.",
                 metadata=metadata,
             )
-            await execution_service.update_next_run_at(session, wintern)
+            if advance_schedule:
+                await execution_service.update_next_run_at(session, wintern)
             return run_id
 
         # Step 4: Curate content
@@ -339,7 +347,8 @@ async def execute_wintern(
                 digest_content="No relevant content found after curation.",
                 metadata=metadata,
             )
-            await execution_service.update_next_run_at(session, wintern)
+            if advance_schedule:
+                await execution_service.update_next_run_at(session, wintern)
             return run_id
 
         # Step 6: Compose digest
@@ -428,7 +437,8 @@ async def execute_wintern(
                 error_msg,
                 metadata=metadata,
             )
-            await execution_service.update_next_run_at(session, wintern)
+            if advance_schedule:
+                await execution_service.update_next_run_at(session, wintern)
             raise ExecutionError(error_msg)
 
         # At least one delivery succeeded - complete the run
@@ -438,7 +448,8 @@ async def execute_wintern(
             digest_content=digest_content.body_plain,
             metadata=metadata,
         )
-        await execution_service.update_next_run_at(session, wintern)
+        if advance_schedule:
+            await execution_service.update_next_run_at(session, wintern)
 
         log.info(
             "Wintern execution complete",
@@ -454,14 +465,16 @@ async def execute_wintern(
             session, run, "No active sources configured", metadata=metadata
         )
         # Advance to next scheduled time to avoid retry spam
-        await execution_service.update_next_run_at(session, wintern)
+        if advance_schedule:
+            await execution_service.update_next_run_at(session, wintern)
         raise
     except NoDeliveryConfiguredError:
         await execution_service.fail_run(
             session, run, "No active delivery channels configured", metadata=metadata
         )
         # Advance to next scheduled time to avoid retry spam
-        await execution_service.update_next_run_at(session, wintern)
+        if advance_schedule:
+            await execution_service.update_next_run_at(session, wintern)
         raise
     except Exception as e:
         log.error(
@@ -472,5 +485,6 @@ async def execute_wintern(
         )
         await execution_service.fail_run(session, run, str(e), metadata=metadata)
         # Advance to next scheduled time to avoid retry spam
-        await execution_service.update_next_run_at(session, wintern)
+        if advance_schedule:
+            await execution_service.update_next_run_at(session, wintern)
         raise ExecutionError(f"Execution failed: {e}") from e
@@ -12,6 +12,7 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from wintern.core.database import Base, TimestampMixin
+from wintern.core.ids import new_id
 
 if TYPE_CHECKING:
     from wintern.winterns.models import Wintern
@@ -31,7 +32,7 @@ class WinternRun(TimestampMixin, Base):
 
     __tablename__ = "wintern_runs"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=new_id)
     wintern_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("winterns.id", ondelete="CASCADE"), nullable=False
     )
@@ -62,7 +63,7 @@ class SeenContent(Base):
 
     __tablename__ = "seen_content"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=new_id)
     wintern_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("winterns.id", ondelete="CASCADE"), nullable=False
     )
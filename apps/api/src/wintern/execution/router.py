@@ -13,6 +13,7 @@ from wintern.auth.dependencies import current_user
 from wintern.auth.models import User
 from wintern.auth.service import get_async_session
 from wintern.core.database import async_session
+from wintern.core.exceptions import APIError, ErrorCode
 from wintern.execution import service as execution_service
 from wintern.execution.executor import ExecutionError, execute_wintern
 from wintern.execution.schemas import (
@@ -97,14 +98,16 @@ async def trigger_run(
     active_deliveries = [d for d in wintern.delivery_configs if d.is_active]
 
     if not active_sources:
-        raise HTTPException(
+        raise APIError(
             status_code=status.HTTP_400_BAD_REQUEST,
+            error_code=ErrorCode.NO_ACTIVE_SOURCES,
             detail="No active sources configured for this wintern",
         )
 
     if not active_deliveries:
-        raise HTTPException(
+        raise APIError(
             status_code=status.HTTP_400_BAD_REQUEST,
+            error_code=ErrorCode.NO_ACTIVE_DELIVERIES,
             detail="No active delivery channels configured for this wintern",
         )
 
@@ -6,21 +6,43 @@ running winterns based on their cron schedules.
 
 from __future__ import annotations
 
+import asyncio
+import socket
+from datetime import UTC, datetime, timedelta
+
 import structlog
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
+from wintern.core.config import settings
 from wintern.core.database import async_session
 from wintern.execution import service as execution_service
 from wintern.execution.executor import ExecutionError, execute_wintern
+from wintern.winterns.models import Wintern
 
 log = structlog.get_logger()
 
 # Global scheduler instance
 _scheduler: AsyncIOScheduler | None = None
 
-# Interval between checks for due winterns (in seconds)
+# Socket held while this process owns the scheduler lock
+_leader_lock: socket.socket | None = None
+
+# ID of the job that checks for due winterns
+CHECK_JOB_ID = "check_due_winterns"
+
+# Longest time between checks for due winterns (in seconds). The check job is
+# normally woken at the next wintern's next_run_at, but schedule_check_at only
+# hears about winterns changed in this process, so this bounds how late a
+# wintern created or rescheduled through another worker can run.
 CHECK_INTERVAL_SECONDS = 300  # 5 minutes
 
+# Shortest time between checks, so a wintern whose next_run_at was never
+# advanced cannot make the check job spin
+MIN_CHECK_DELAY_SECONDS = 30
+
+# Maximum number of due winterns executed at once
+MAX_CONCURRENT_EXECUTIONS = 5
+
 
 def setup_scheduler() -> AsyncIOScheduler:
     """Configure and create the AsyncIOScheduler.
@@ -42,63 +64,194 @@ def setup_scheduler() -> AsyncIOScheduler:
 async def check_and_run_due_winterns() -> None:
     """Job that checks for and executes due winterns.
 
-    This is the main scheduled job that runs every CHECK_INTERVAL_SECONDS.
-    It queries for all winterns that are due to run and executes them.
+    This is the main scheduled job. It queries for all winterns that are due
+    to run, executes them concurrently (at most MAX_CONCURRENT_EXECUTIONS at a
+    time), then reschedules itself for when the next wintern is due.
     """
     log.debug("Checking for due winterns")
 
-    async with async_session() as session:
-        try:
-            due_winterns = await execution_service.get_due_winterns(session)
+    # One clock read per tick: the due-wintern query and every claim share it
+    now = datetime.now(UTC)
+
+    try:
+        # Load in a short-lived session so no connection is held while the
+        # winterns execute; each execution opens its own session
+        async with async_session() as session:
+            due_winterns = await execution_service.get_due_winterns(session, as_of=now)
+
+        if not due_winterns:
+            log.debug("No winterns due for execution")
+            return
+
+        log.info("Found due winterns", count=len(due_winterns))
+
+        # Run due winterns concurrently, each in its own session, since
+        # an AsyncSession cannot be shared between concurrent tasks
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_EXECUTIONS)
+        await asyncio.gather(
+            *(_run_scheduled_wintern(wintern, now, semaphore) for wintern in due_winterns),
+            return_exceptions=True,
+        )
+
+    except Exception as e:
+        log.error("Error checking for due winterns", error=str(e))
+
+    finally:
+        await _schedule_next_check()
 
-            if not due_winterns:
-                log.debug("No winterns due for execution")
-                return
 
-            log.info("Found due winterns", count=len(due_winterns))
-
-            for wintern in due_winterns:
-                try:
-                    log.info(
-                        "Executing scheduled wintern",
-                        wintern_id=str(wintern.id),
-                        wintern_name=wintern.name,
-                    )
-                    # Execute in the same session to maintain transaction
-                    await execute_wintern(session, wintern.id)
-                    await session.commit()
-                    log.info(
-                        "Scheduled wintern completed",
-                        wintern_id=str(wintern.id),
-                        wintern_name=wintern.name,
-                    )
-                except ExecutionError as e:
-                    log.error(
-                        "Scheduled wintern execution failed",
-                        wintern_id=str(wintern.id),
-                        wintern_name=wintern.name,
-                        error=str(e),
-                    )
-                    await session.commit()  # Commit the failure record
-                except Exception as e:
-                    log.error(
-                        "Unexpected error during scheduled execution",
-                        wintern_id=str(wintern.id),
-                        wintern_name=wintern.name,
-                        error=str(e),
-                    )
-                    await session.rollback()
+async def _run_scheduled_wintern(
+    wintern: Wintern, now: datetime, semaphore: asyncio.Semaphore
+) -> None:
+    """Claim and execute one due wintern in its own session, logging any failure.
 
+    The run is claimed and committed first, so when several scheduler
+    instances find the same due wintern only one of them executes it.
+
+    Args:
+        wintern: The due wintern, as loaded by get_due_winterns.
+        now: The tick's time, used to schedule the wintern's next run.
+        semaphore: Bounds how many winterns execute at once.
+    """
+    wintern_id = wintern.id
+    wintern_name = wintern.name
+
+    async with semaphore, async_session() as session:
+        try:
+            if not await execution_service.claim_wintern_run(session, wintern, as_of=now):
+                log.info(
+                    "Scheduled wintern already claimed by another instance",
+                    wintern_id=str(wintern_id),
+                    wintern_name=wintern_name,
+                )
+                return
+            await session.commit()
+
+            log.info(
+                "Executing scheduled wintern",
+                wintern_id=str(wintern_id),
+                wintern_name=wintern_name,
+            )
+            # The claim already advanced next_run_at from the tick's time
+            await execute_wintern(session, wintern_id, advance_schedule=False)
+            await session.commit()
+            log.info(
+                "Scheduled wintern completed",
+                wintern_id=str(wintern_id),
+                wintern_name=wintern_name,
+            )
+        except ExecutionError as e:
+            log.error(
+                "Scheduled wintern execution failed",
+                wintern_id=str(wintern_id),
+                wintern_name=wintern_name,
+                error=str(e),
+            )
+            await session.commit()  # Commit the failure record
         except Exception as e:
-            log.error("Error checking for due winterns", error=str(e))
+            log.error(
+                "Unexpected error during scheduled execution",
+                wintern_id=str(wintern_id),
+                wintern_name=wintern_name,
+                error=str(e),
+            )
             await session.rollback()
 
 
-def start_scheduler() -> AsyncIOScheduler:
+async def _schedule_next_check() -> None:
+    """Move the check job to when the next wintern is due.
+
+    The wake-up time is clamped between MIN_CHECK_DELAY_SECONDS and
+    CHECK_INTERVAL_SECONDS from now.
+    """
+    if _scheduler is None or not _scheduler.running:
+        return
+
+    try:
+        async with async_session() as session:
+            next_run_at = await execution_service.get_earliest_next_run_at(session)
+    except Exception as e:
+        log.error("Error finding next wintern run time", error=str(e))
+        next_run_at = None
+
+    now = datetime.now(UTC)
+    wake_at = now + timedelta(seconds=CHECK_INTERVAL_SECONDS)
+    if next_run_at is not None:
+        earliest = now + timedelta(seconds=MIN_CHECK_DELAY_SECONDS)
+        wake_at = min(wake_at, max(next_run_at, earliest))
+
+    job = _scheduler.get_job(CHECK_JOB_ID)
+    if job is not None:
+        job.modify(next_run_time=wake_at)
+        log.debug("Next due-wintern check scheduled", next_check_at=wake_at.isoformat())
+
+
+def schedule_check_at(run_at: datetime | None) -> None:
+    """Wake the check job by run_at if it would otherwise sleep past it.
+
+    Registered with execution_service.set_next_run_listener while the
+    scheduler runs, so a wintern whose next_run_at is set in this process
+    runs on time instead of at the next safety-net check.
+
+    Args:
+        run_at: When a wintern is next due, or None if it is not scheduled.
+    """
+    if run_at is None or _scheduler is None or not _scheduler.running:
+        return
+
+    job = _scheduler.get_job(CHECK_JOB_ID)
+    if job is None:
+        return
+
+    if job.next_run_time is None or run_at < job.next_run_time:
+        job.modify(next_run_time=run_at)
+        log.debug("Due-wintern check moved earlier", next_check_at=run_at.isoformat())
+
+
+def _try_acquire_leader_lock() -> bool:
+    """Try to become the one process on this host that runs the scheduler.
+
+    Binds settings.scheduler_lock_port on localhost. The OS frees the port if
+    the process dies, so a crashed worker cannot leave the lock held.
+
+    Returns:
+        True if this process holds the lock or no lock port is configured.
+    """
+    global _leader_lock
+
+    if settings.scheduler_lock_port is None or _leader_lock is not None:
+        return True
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        sock.bind(("127.0.0.1", settings.scheduler_lock_port))
+        sock.listen(1)
+    except OSError:
+        sock.close()
+        return False
+
+    _leader_lock = sock
+    return True
+
+
+def _release_leader_lock() -> None:
+    """Release the scheduler lock if this process holds it."""
+    global _leader_lock
+
+    if _leader_lock is not None:
+        _leader_lock.close()
+        _leader_lock = None
+
+
+def start_scheduler() -> AsyncIOScheduler | None:
     """Start the scheduler and add the check job.
 
+    When settings.scheduler_lock_port is set, only the first process on the
+    host to bind it starts a scheduler; other workers skip it.
+
     Returns:
-        The started scheduler instance.
+        The started scheduler instance, or None if another process already
+        runs the scheduler.
     """
     global _scheduler
 
@@ -106,19 +259,31 @@ def start_scheduler() -> AsyncIOScheduler:
         log.warning("Scheduler already running")
         return _scheduler
 
+    if not _try_acquire_leader_lock():
+        log.info(
+            "Scheduler lock held by another process, not starting scheduler",
+            lock_port=settings.scheduler_lock_port,
+        )
+        return None
+
     _scheduler = setup_scheduler()
 
-    # Add the check job
+    # Add the check job. Jobs live in memory, since the schedule itself is
+    # persisted as each wintern's next_run_at; run the first check shortly
+    # after startup so runs missed while the app was down are picked up then
+    # rather than after a full CHECK_INTERVAL_SECONDS.
     _scheduler.add_job(
         check_and_run_due_winterns,
         "interval",
         seconds=CHECK_INTERVAL_SECONDS,
-        id="check_due_winterns",
+        id=CHECK_JOB_ID,
         name="Check and run due winterns",
         replace_existing=True,
+        next_run_time=datetime.now(UTC) + timedelta(seconds=MIN_CHECK_DELAY_SECONDS),
     )
 
     _scheduler.start()
+    execution_service.set_next_run_listener(schedule_check_at)
     log.info(
         "Scheduler started",
         check_interval_seconds=CHECK_INTERVAL_SECONDS,
@@ -143,8 +308,10 @@ async def shutdown_scheduler() -> None:
         return
 
     log.info("Shutting down scheduler")
+    execution_service.set_next_run_listener(None)
     _scheduler.shutdown(wait=True)
     _scheduler = None
+    _release_leader_lock()
     log.info("Scheduler shutdown complete")
 
 
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import hashlib
 import uuid
+from collections.abc import Callable
 from datetime import UTC, datetime
+from typing import cast
 
 from croniter import croniter
-from sqlalchemy import func, select
+from sqlalchemy import CursorResult, func, select, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -251,8 +253,9 @@ async def record_seen_content_batch(
 ) -> int:
     """Record multiple pieces of content as seen in a batch.
 
-    Uses ON CONFLICT DO NOTHING to handle duplicates gracefully,
-    which can occur with concurrent or manual+scheduled runs.
+    Uses a single multi-row INSERT ... ON CONFLICT DO NOTHING RETURNING
+    statement, so the whole batch costs one round trip. Duplicates, which
+    can occur with concurrent or manual+scheduled runs, are skipped.
 
     Args:
         session: The database session.
@@ -279,20 +282,47 @@ async def record_seen_content_batch(
         for url, source_type in items
     ]
 
-    # Use PostgreSQL INSERT ... ON CONFLICT DO NOTHING
-    stmt = pg_insert(SeenContent).values(values)
-    stmt = stmt.on_conflict_do_nothing(index_elements=["wintern_id", "content_hash"])
-    cursor_result = await session.execute(stmt)
-    # rowcount returns the number of rows affected (inserted)
-    # CursorResult has rowcount, but the async wrapper type doesn't expose it
-    rowcount: int = getattr(cursor_result, "rowcount", 0) or 0
-    return rowcount
+    # Use PostgreSQL INSERT ... ON CONFLICT DO NOTHING RETURNING
+    # Only rows that were actually inserted are returned, so counting them
+    # gives the inserted count without relying on driver-specific rowcount.
+    stmt = (
+        pg_insert(SeenContent)
+        .values(values)
+        .on_conflict_do_nothing(index_elements=["wintern_id", "content_hash"])
+        .returning(SeenContent.id)
+    )
+    result = await session.execute(stmt)
+    return len(result.scalars().all())
 
 
 # -----------------------------------------------------------------------------
 # Scheduling Operations
 # -----------------------------------------------------------------------------
 
+# Told when a wintern's next_run_at is set; registered by the scheduler while
+# it runs in this process
+_next_run_listener: Callable[[datetime], None] | None = None
+
+
+def set_next_run_listener(listener: Callable[[datetime], None] | None) -> None:
+    """Register the callback notify_next_run_at forwards to.
+
+    Args:
+        listener: Called with each newly set run time, or None to clear it.
+    """
+    global _next_run_listener
+    _next_run_listener = listener
+
+
+def notify_next_run_at(run_at: datetime | None) -> None:
+    """Tell the scheduler, if one runs in this process, that a wintern is due at run_at.
+
+    Args:
+        run_at: The wintern's new next_run_at, or None if it is not scheduled.
+    """
+    if run_at is not None and _next_run_listener is not None:
+        _next_run_listener(run_at)
+
 
 async def get_due_winterns(
     session: AsyncSession,
@@ -304,6 +334,10 @@ async def get_due_winterns(
     - It is active (is_active=True)
     - It has a next_run_at time that is in the past
 
+    Relationships are not loaded: the scheduler only needs the wintern's own
+    columns, and execute_wintern reloads each wintern with its configs via
+    get_wintern_for_execution, so this stays a single query per tick.
+
     Args:
         session: The database session.
         as_of: The time to check against. Defaults to now.
@@ -314,22 +348,36 @@ async def get_due_winterns(
     if as_of is None:
         as_of = datetime.now(UTC)
 
-    stmt = (
-        select(Wintern)
-        .where(
-            Wintern.is_active == True,  # noqa: E712
-            Wintern.next_run_at.isnot(None),
-            Wintern.next_run_at <= as_of,
-        )
-        .options(
-            selectinload(Wintern.source_configs),
-            selectinload(Wintern.delivery_configs),
-        )
+    stmt = select(Wintern).where(
+        Wintern.is_active == True,  # noqa: E712
+        Wintern.next_run_at.isnot(None),
+        Wintern.next_run_at <= as_of,
     )
     result = await session.execute(stmt)
     return list(result.scalars().all())
 
 
+async def get_earliest_next_run_at(session: AsyncSession) -> datetime | None:
+    """Get the soonest next_run_at across all active winterns.
+
+    Args:
+        session: The database session.
+
+    Returns:
+        The earliest scheduled run time, or None if nothing is scheduled.
+    """
+    stmt = select(func.min(Wintern.next_run_at)).where(
+        Wintern.is_active == True  # noqa: E712
+    )
+    next_run_at = await session.scalar(stmt)
+
+    # Ensure timezone awareness
+    if next_run_at is not None and next_run_at.tzinfo is None:
+        next_run_at = next_run_at.replace(tzinfo=UTC)
+
+    return next_run_at
+
+
 def calculate_next_run_at(
     cron_schedule: str,
     base_time: datetime | None = None,
@@ -356,6 +404,44 @@ def calculate_next_run_at(
     return next_time
 
 
+async def claim_wintern_run(
+    session: AsyncSession,
+    wintern: Wintern,
+    as_of: datetime | None = None,
+) -> bool:
+    """Claim a due wintern's run so only one scheduler instance executes it.
+
+    Advances next_run_at with a compare-and-set against the value the wintern
+    was loaded with. When several instances load the same due wintern, only
+    the first update matches a row; the others see it already advanced. The
+    claim must be committed before executing so other instances can see it,
+    and the claimed run executed with advance_schedule=False so next_run_at
+    is only moved here.
+
+    Args:
+        session: The database session.
+        wintern: The due wintern, as loaded by get_due_winterns.
+        as_of: The time to schedule the next run from. Defaults to now.
+
+    Returns:
+        True if this caller claimed the run, False if another already had.
+    """
+    next_run_at = (
+        calculate_next_run_at(wintern.cron_schedule, as_of) if wintern.cron_schedule else None
+    )
+    stmt = (
+        update(Wintern)
+        .where(
+            Wintern.id == wintern.id,
+            Wintern.next_run_at == wintern.next_run_at,
+        )
+        .values(next_run_at=next_run_at)
+        .execution_options(synchronize_session=False)
+    )
+    result = cast(CursorResult, await session.execute(stmt))
+    return result.rowcount == 1
+
+
 async def update_next_run_at(
     session: AsyncSession,
     wintern: Wintern,
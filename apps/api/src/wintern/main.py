@@ -11,9 +11,11 @@ from fastapi.middleware.cors import CORSMiddleware
 from wintern.auth import models as auth_models  # noqa: F401
 from wintern.auth.router import router as auth_router
 from wintern.core.config import settings
+from wintern.core.exceptions import APIError, api_error_handler
 from wintern.execution import models as execution_models  # noqa: F401
 from wintern.execution.router import router as execution_router
 from wintern.execution.scheduler import shutdown_scheduler, start_scheduler
+from wintern.sources.reddit import shutdown_reddit
 from wintern.winterns import models as winterns_models  # noqa: F401
 from wintern.winterns.router import router as winterns_router
 
@@ -32,6 +34,8 @@ async def lifespan(app: FastAPI):
 
     # Shutdown the scheduler gracefully
     await shutdown_scheduler()
+    # Close the shared Reddit client and its HTTP session
+    await shutdown_reddit()
     log.info("Shutting down Wintern API")
 
 
@@ -50,6 +54,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_exception_handler(APIError, api_error_handler)
+
 # Include routers
 app.include_router(auth_router)
 app.include_router(winterns_router)
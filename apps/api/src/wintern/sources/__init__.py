@@ -20,6 +20,7 @@ from wintern.sources.reddit import (
     TimeFilter,
     reddit_source,
     search_reddit,
+    shutdown_reddit,
 )
 from wintern.sources.schemas import SearchResult
 
@@ -42,4 +43,5 @@ __all__ = [
     "reddit_source",
     "search_brave",
     "search_reddit",
+    "shutdown_reddit",
 ]
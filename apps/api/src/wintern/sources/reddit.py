@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import UTC, datetime
-from typing import Literal
+from functools import lru_cache
+from itertools import chain, zip_longest
+from typing import Literal, get_args
 
 import asyncpraw
 import asyncpraw.reddit
@@ -23,6 +26,20 @@ logger = logging.getLogger(__name__)
 
 # Time filter options matching Reddit's API
 TimeFilter = Literal["hour", "day", "week", "month", "year", "all"]
+_VALID_TIME_FILTERS: frozenset[str] = frozenset(get_args(TimeFilter))
+DEFAULT_TIME_FILTER: TimeFilter = "week"
+
+# Submission attributes that mark a post as removed when set
+_REMOVAL_ATTRS = frozenset({"removed_by_category", "banned_by", "removal_reason"})
+
+# Largest page size Reddit's search accepts
+_MAX_LIMIT = 100
+
+# Maximum concurrent per-subreddit searches when fanning out
+MAX_PARALLEL_SUBREDDITS = 5
+
+# Shared client instance, created on first search
+_default_client: asyncpraw.Reddit | None = None
 
 
 class RedditError(Exception):
@@ -71,6 +88,77 @@ def _create_reddit_client() -> asyncpraw.Reddit:
     )
 
 
+def _get_default_client() -> asyncpraw.Reddit:
+    """Get the shared Reddit client, creating it on first use.
+
+    Reusing one client keeps its HTTP session and OAuth token alive across
+    searches instead of re-authenticating for every call.
+
+    Returns:
+        The shared AsyncPRAW Reddit client.
+
+    Raises:
+        RedditCredentialsMissingError: If credentials are not configured.
+    """
+    global _default_client
+
+    if _default_client is None:
+        _default_client = _create_reddit_client()
+    return _default_client
+
+
+async def shutdown_reddit() -> None:
+    """Close the shared Reddit client if one was created."""
+    global _default_client
+
+    if _default_client is not None:
+        client, _default_client = _default_client, None
+        await client.close()
+
+
+@lru_cache(maxsize=4096)
+def _parse_created_utc_cached(created_utc: float) -> datetime | None:
+    """Convert a timestamp to a UTC datetime; see _parse_created_utc."""
+    try:
+        return datetime.fromtimestamp(created_utc, tz=UTC)
+    except (ValueError, OSError, OverflowError):
+        return None
+
+
+def _parse_created_utc(created_utc: float | None) -> datetime | None:
+    """Parse a Reddit ``created_utc`` timestamp into a UTC datetime.
+
+    Results are cached, since the same posts resurface across searches.
+
+    Args:
+        created_utc: Seconds since the epoch, or None.
+
+    Returns:
+        A UTC-aware datetime, or None if missing or out of range.
+    """
+    if not created_utc:
+        return None
+    return _parse_created_utc_cached(created_utc)
+
+
+@lru_cache(maxsize=256)
+def _subreddit_name(subreddits: tuple[str, ...]) -> str:
+    """Build the subreddit path to search, e.g. ``"python+programming"``.
+
+    Args:
+        subreddits: Subreddits to search in; empty for all of Reddit.
+
+    Returns:
+        The ``+``-joined subreddit names, or ``"all"``.
+    """
+    return "+".join(subreddits) if subreddits else "all"
+
+
+def _is_removed(submission: asyncpraw.reddit.Submission) -> bool:
+    """Return whether Reddit marks the submission as removed or deleted."""
+    return any(getattr(submission, attr, None) for attr in _REMOVAL_ATTRS)
+
+
 def _submission_to_search_result(submission: asyncpraw.reddit.Submission) -> SearchResult:
     """Convert an AsyncPRAW Submission to a SearchResult.
 
@@ -84,13 +172,7 @@ def _submission_to_search_result(submission: asyncpraw.reddit.Submission) -> Sea
     selftext = getattr(submission, "selftext", "") or ""
     snippet = selftext[:500] if selftext else submission.title
 
-    # Parse created_utc to datetime
-    published_at = None
-    if hasattr(submission, "created_utc") and submission.created_utc:
-        try:
-            published_at = datetime.fromtimestamp(submission.created_utc, tz=UTC)
-        except (ValueError, OSError, OverflowError):
-            pass
+    published_at = _parse_created_utc(getattr(submission, "created_utc", None))
 
     return SearchResult(
         url=f"https://www.reddit.com{submission.permalink}",
@@ -109,12 +191,48 @@ def _submission_to_search_result(submission: asyncpraw.reddit.Submission) -> Sea
     )
 
 
+async def _search_subreddit(
+    reddit: asyncpraw.Reddit,
+    name: str,
+    query: str,
+    *,
+    time_filter: TimeFilter,
+    count: int,
+) -> list[SearchResult]:
+    """Run one search against a subreddit path, skipping removed posts.
+
+    Args:
+        reddit: Client to search with.
+        name: Subreddit path, e.g. ``"python"``, ``"python+programming"`` or ``"all"``.
+        query: The search query string.
+        time_filter: Time filter for results.
+        count: Maximum number of posts to request.
+
+    Returns:
+        A list of SearchResult objects.
+    """
+    subreddit = await reddit.subreddit(name)
+
+    return [
+        _submission_to_search_result(submission)
+        async for submission in subreddit.search(
+            query,
+            sort="relevance",
+            time_filter=time_filter,
+            limit=count,
+        )
+        if not _is_removed(submission)
+    ]
+
+
 async def search_reddit(
     query: str,
     *,
     subreddits: list[str] | None = None,
-    time_filter: TimeFilter = "week",
+    time_filter: TimeFilter = DEFAULT_TIME_FILTER,
     count: int = 25,
+    parallel_subreddits: bool = False,
+    reddit: asyncpraw.Reddit | None = None,
 ) -> list[SearchResult]:
     """Search Reddit for posts matching the query.
 
@@ -129,6 +247,14 @@ async def search_reddit(
             - "year": Past year
             - "all": All time
         count: Maximum number of results to return (1-100).
+        parallel_subreddits: Search each subreddit separately and concurrently
+            (at most MAX_PARALLEL_SUBREDDITS at a time) instead of as one
+            combined ``a+b`` search. Results are interleaved round-robin
+            across subreddits, de-duplicated by URL and truncated to
+            ``count``. A subreddit whose search fails with a Reddit API error
+            is logged and skipped, unless every subreddit fails.
+        reddit: Client to search with. Defaults to the shared client, which
+            stays open until shutdown_reddit() is called.
 
     Returns:
         A list of SearchResult objects.
@@ -139,32 +265,58 @@ async def search_reddit(
         RedditAPIError: For other API errors.
     """
     # Clamp count to valid range
-    count = max(1, min(100, count))
+    count = max(1, min(_MAX_LIMIT, count))
 
-    reddit = _create_reddit_client()
+    client = reddit if reddit is not None else _get_default_client()
 
     try:
-        results: list[SearchResult] = []
-
-        if subreddits:
-            # Search within specific subreddits
-            subreddit_str = "+".join(subreddits)
-            subreddit = await reddit.subreddit(subreddit_str)
+        if parallel_subreddits and subreddits and len(subreddits) > 1:
+            semaphore = asyncio.Semaphore(MAX_PARALLEL_SUBREDDITS)
+
+            async def _bounded_search(name: str) -> list[SearchResult]:
+                async with semaphore:
+                    return await _search_subreddit(
+                        client, name, query, time_filter=time_filter, count=count
+                    )
+
+            batches = await asyncio.gather(
+                *(_bounded_search(name) for name in subreddits), return_exceptions=True
+            )
+
+            # A Reddit error in one subreddit only loses that subreddit's
+            # results; anything else, or every subreddit failing, still raises
+            errors = [batch for batch in batches if isinstance(batch, BaseException)]
+            for error in errors:
+                if not isinstance(error, AsyncPrawcoreException):
+                    raise error
+            if len(errors) == len(batches):
+                raise errors[0]
+
+            found: list[list[SearchResult]] = []
+            for name, batch in zip(subreddits, batches, strict=True):
+                if isinstance(batch, BaseException):
+                    logger.warning(f"Reddit search of r/{name} for '{query}' failed: {batch}")
+                else:
+                    found.append(batch)
+
+            # Interleave the batches round-robin so every subreddit contributes
+            # before truncating, dropping posts seen in more than one subreddit
+            seen_urls: set[str] = set()
+            results: list[SearchResult] = []
+            for result in chain.from_iterable(zip_longest(*found)):
+                if result is not None and result.url not in seen_urls:
+                    seen_urls.add(result.url)
+                    results.append(result)
+                    if len(results) == count:
+                        break
         else:
-            # Search all of Reddit
-            subreddit = await reddit.subreddit("all")
-
-        async for submission in subreddit.search(
-            query,
-            sort="relevance",
-            time_filter=time_filter,
-            limit=count,
-        ):
-            # Skip removed/deleted posts
-            if getattr(submission, "removed_by_category", None):
-                continue
-
-            results.append(_submission_to_search_result(submission))
+            results = await _search_subreddit(
+                client,
+                _subreddit_name(tuple(subreddits or ())),
+                query,
+                time_filter=time_filter,
+                count=count,
+            )
 
         logger.debug(f"Reddit search for '{query}' returned {len(results)} results")
         return results
@@ -177,8 +329,6 @@ async def search_reddit(
         raise RedditAPIError(f"Response error: {e}") from e
     except AsyncPrawcoreException as e:
         raise RedditAPIError(str(e)) from e
-    finally:
-        await reddit.close()
 
 
 class RedditSource(DataSource):
@@ -204,6 +354,7 @@ class RedditSource(DataSource):
             **kwargs: Additional parameters:
                 - subreddits: list[str] for specific subreddit search
                 - time_filter: TimeFilter for time-based filtering
+                - parallel_subreddits: bool to search each subreddit concurrently
 
         Returns:
             A list of SearchResult objects.
@@ -212,23 +363,22 @@ class RedditSource(DataSource):
         if subreddits is not None and not isinstance(subreddits, list):
             subreddits = None
 
-        time_filter = kwargs.get("time_filter", "week")
-        if time_filter not in ("hour", "day", "week", "month", "year", "all"):
-            time_filter = "week"
+        time_filter = kwargs.get("time_filter", DEFAULT_TIME_FILTER)
+        if time_filter not in _VALID_TIME_FILTERS:
+            time_filter = DEFAULT_TIME_FILTER
 
         return await search_reddit(
             query,
             subreddits=subreddits,
             time_filter=time_filter,  # type: ignore[arg-type]
             count=count,
+            parallel_subreddits=bool(kwargs.get("parallel_subreddits", False)),
         )
 
     async def health_check(self) -> bool:
         """Check if Reddit is configured and available."""
-        if not settings.reddit_client_id or not settings.reddit_client_secret:
-            return False
-
         try:
+            # Raises RedditCredentialsMissingError when credentials are not set
             reddit = _create_reddit_client()
             try:
                 # Verify credentials by making an authenticated API call
@@ -12,6 +12,7 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from wintern.core.database import Base, TimestampMixin
+from wintern.core.ids import new_id
 
 if TYPE_CHECKING:
     from wintern.execution.models import WinternRun
@@ -39,7 +40,7 @@ class Wintern(TimestampMixin, Base):
 
     __tablename__ = "winterns"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=new_id)
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
@@ -72,7 +73,7 @@ class SourceConfig(TimestampMixin, Base):
 
     __tablename__ = "source_configs"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=new_id)
     wintern_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("winterns.id", ondelete="CASCADE"), nullable=False
     )
@@ -91,7 +92,7 @@ class DeliveryConfig(TimestampMixin, Base):
 
     __tablename__ = "delivery_configs"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=new_id)
     wintern_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("winterns.id", ondelete="CASCADE"), nullable=False
     )
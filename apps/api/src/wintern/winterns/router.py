@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from wintern.auth.dependencies import current_user
 from wintern.auth.models import User
 from wintern.auth.service import get_async_session
+from wintern.execution import service as execution_service
 from wintern.winterns import service as wintern_service
 from wintern.winterns.schemas import (
     WinternCreate,
@@ -54,6 +55,7 @@ async def create_wintern(
 ) -> WinternResponse:
     """Create a new Wintern."""
     wintern = await wintern_service.create_wintern(session, user.id, data)
+    execution_service.notify_next_run_at(wintern.next_run_at)
     return WinternResponse.model_validate(wintern)
 
 
@@ -88,6 +90,7 @@ async def update_wintern(
             detail="Wintern not found",
         )
     updated = await wintern_service.update_wintern(session, wintern, data)
+    execution_service.notify_next_run_at(updated.next_run_at)
     return WinternResponse.model_validate(updated)
 
 
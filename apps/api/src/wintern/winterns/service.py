@@ -53,7 +53,8 @@ async def list_winterns_for_user(
         select(Wintern)
         .options(selectinload(Wintern.source_configs), selectinload(Wintern.delivery_configs))
         .where(Wintern.user_id == user_id)
-        .order_by(Wintern.created_at.desc())
+        # id breaks created_at ties so pages never overlap or skip rows
+        .order_by(Wintern.created_at.desc(), Wintern.id.desc())
         .offset(skip)
         .limit(limit)
     )
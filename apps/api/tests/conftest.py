@@ -1,16 +1,30 @@
 """Pytest configuration and fixtures."""
 
 import asyncio
-from collections.abc import AsyncGenerator
+import importlib
+import os
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Mapping
+from contextlib import asynccontextmanager
+from typing import Any
 
 import pytest
 import pytest_asyncio
+from fastapi_users.password import PasswordHelper
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import StaticPool
 
 # Import all models to register them with SQLAlchemy
 from wintern.auth import models as auth_models  # noqa: F401
-from wintern.auth.service import get_async_session
+from wintern.auth.service import UserDbDep, UserManager, get_async_session, get_user_manager
 from wintern.core.database import Base
 from wintern.execution import models as execution_models  # noqa: F401
 from wintern.main import app
@@ -19,18 +33,78 @@ from wintern.winterns import models as winterns_models  # noqa: F401
 # Use in-memory SQLite for tests
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
+# Argon2 at its minimum cost: hashing strength is irrelevant for throwaway test
+# users, and the production defaults dominate the runtime of auth-heavy tests
+FAST_PASSWORD_HELPER = PasswordHelper(
+    PasswordHash((Argon2Hasher(time_cost=1, memory_cost=8, parallelism=1),))
+)
+
+
+def pytest_asyncio_loop_factories(
+    config: pytest.Config, item: pytest.Item
+) -> Mapping[str, Callable[[], asyncio.AbstractEventLoop]]:
+    """Run async tests on uvloop, falling back to the default asyncio loop.
+
+    uvloop is not available on Windows, where the default loop is used.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
+
+
+_profiler_key = pytest.StashKey[Any]()
+
+
+def pytest_sessionstart(session: pytest.Session) -> None:
+    """Profile the test session with pyinstrument when PROFILE=1 is set.
+
+    Writes profile.html (profile-<worker>.html under xdist) to the working
+    directory, e.g. ``PROFILE=1 pytest tests/test_winterns.py -n0``.
+    pyinstrument is not a project dependency; install it before profiling.
+    """
+    if os.environ.get("PROFILE") != "1":
+        return
+    # Under xdist only the workers run tests; skip profiling the controller
+    if "PYTEST_XDIST_WORKER" not in os.environ and session.config.getoption("numprocesses", None):
+        return
+
+    # Imported by name since pyinstrument is only installed for profiling runs
+    try:
+        pyinstrument = importlib.import_module("pyinstrument")
+    except ImportError as e:
+        raise pytest.UsageError("PROFILE=1 requires pyinstrument") from e
+    profiler = pyinstrument.Profiler(async_mode="enabled")
+    profiler.start()
+    session.config.stash[_profiler_key] = profiler
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """Stop the PROFILE=1 profiler, if running, and write its report."""
+    profiler = session.config.stash.get(_profiler_key, None)
+    if profiler is None:
+        return
+
+    profiler.stop()
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    profiler.write_html(f"profile-{worker}.html" if worker else "profile.html")
+
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def warm_app():
+    """Build the app's OpenAPI schema once for the whole session.
 
+    FastAPI builds and caches the schema lazily, so without this the first
+    test to touch it pays the one-off cost and skews per-test durations.
+    """
+    app.openapi()
+    return app
 
-@pytest_asyncio.fixture
-async def test_engine():
-    """Create a test database engine."""
+
+@asynccontextmanager
+async def _schema_engine() -> AsyncIterator[AsyncEngine]:
+    """Yield a fresh in-memory database engine with the schema created."""
     engine = create_async_engine(TEST_DATABASE_URL, echo=False)
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -41,22 +115,78 @@ async def test_engine():
 
 
 @pytest_asyncio.fixture
-async def test_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create a test database session."""
-    async_session_maker = async_sessionmaker(
-        test_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
+async def test_engine():
+    """Create a test database engine."""
+    async with _schema_engine() as engine:
+        yield engine
+
+
+@pytest_asyncio.fixture(scope="module")
+async def module_engine():
+    """Create a test database engine shared by every test in a module."""
+    async with _schema_engine() as engine:
+        yield engine
+
+
+@pytest_asyncio.fixture(scope="session")
+async def db_connection() -> AsyncGenerator[AsyncConnection, None]:
+    """Open one connection for the test session and hold an outer transaction.
+
+    Sessions bound to this connection run inside SAVEPOINTs that are rolled
+    back when they close, so the schema is only created once and no rows
+    leak between tests. ``StaticPool`` pins the single in-memory database to
+    one DBAPI connection, which aiosqlite drives from its own worker thread.
+    """
+    engine = create_async_engine(
+        TEST_DATABASE_URL,
+        echo=False,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
     )
-    async with async_session_maker() as session:
+    async with engine.connect() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.commit()
+        transaction = await conn.begin()
+        yield conn
+        await transaction.rollback()
+    await engine.dispose()
+
+
+@asynccontextmanager
+async def _savepoint_session(connection: AsyncConnection) -> AsyncIterator[AsyncSession]:
+    """Yield a session whose writes, even committed ones, are rolled back on exit."""
+    savepoint = await connection.begin_nested()
+    async with AsyncSession(
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
+    ) as session:
+        yield session
+    await savepoint.rollback()
+
+
+@pytest_asyncio.fixture(scope="module")
+async def module_session(db_connection) -> AsyncGenerator[AsyncSession, None]:
+    """Create a session for rows shared by every test in a module.
+
+    Its SAVEPOINT is rolled back when the module finishes.
+    """
+    async with _savepoint_session(db_connection) as session:
         yield session
 
 
 @pytest_asyncio.fixture
-async def client(test_engine) -> AsyncGenerator[AsyncClient, None]:
-    """Create an async test client with test database."""
+async def test_session(db_connection) -> AsyncGenerator[AsyncSession, None]:
+    """Create a test database session that is rolled back after the test."""
+    async with _savepoint_session(db_connection) as session:
+        yield session
+
+
+@asynccontextmanager
+async def _app_client(engine: AsyncEngine) -> AsyncIterator[AsyncClient]:
+    """Serve the app over ASGI with its session dependency bound to engine."""
     async_session_maker = async_sessionmaker(
-        test_engine,
+        engine,
         class_=AsyncSession,
         expire_on_commit=False,
     )
@@ -65,8 +195,12 @@ async def client(test_engine) -> AsyncGenerator[AsyncClient, None]:
         async with async_session_maker() as session:
             yield session
 
+    async def get_test_user_manager(user_db: UserDbDep) -> AsyncGenerator[UserManager, None]:
+        yield UserManager(user_db, FAST_PASSWORD_HELPER)
+
     # Override the session dependency
     app.dependency_overrides[get_async_session] = get_test_session
+    app.dependency_overrides[get_user_manager] = get_test_user_manager
 
     async with AsyncClient(
         transport=ASGITransport(app=app),
@@ -75,3 +209,21 @@ async def client(test_engine) -> AsyncGenerator[AsyncClient, None]:
         yield ac
 
     app.dependency_overrides.clear()
+
+
+@pytest_asyncio.fixture
+async def client(test_engine, warm_app) -> AsyncGenerator[AsyncClient, None]:
+    """Create an async test client with test database."""
+    async with _app_client(test_engine) as ac:
+        yield ac
+
+
+@pytest_asyncio.fixture(scope="module")
+async def module_client(module_engine, warm_app) -> AsyncGenerator[AsyncClient, None]:
+    """Create an async test client whose database lasts for the whole module.
+
+    Rows written by one test stay visible to later tests in the module, so
+    tests must not rely on another test's users or winterns.
+    """
+    async with _app_client(module_engine) as ac:
+        yield ac
@@ -1,5 +1,6 @@
 """Tests for the digest composer agent."""
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -453,8 +454,7 @@ class TestComposeDigest:
             item_count=1,
         )
 
-        mock_agent_result = MagicMock()
-        mock_agent_result.output = mock_result_data
+        mock_agent_result = SimpleNamespace(output=mock_result_data)
 
         mock_agent = MagicMock()
         mock_agent.run = AsyncMock(return_value=mock_agent_result)
@@ -484,8 +484,7 @@ class TestComposeDigest:
             item_count=0,
         )
 
-        mock_agent_result = MagicMock()
-        mock_agent_result.output = mock_result_data
+        mock_agent_result = SimpleNamespace(output=mock_result_data)
 
         with patch("wintern.agents.composer.create_composer_agent") as mock_create:
             mock_agent = MagicMock()
@@ -526,8 +525,7 @@ class TestComposeDigest:
             item_count=1,
         )
 
-        mock_agent_result = MagicMock()
-        mock_agent_result.output = mock_result_data
+        mock_agent_result = SimpleNamespace(output=mock_result_data)
 
         mock_agent = MagicMock()
         mock_agent.run = AsyncMock(return_value=mock_agent_result)
@@ -1,5 +1,6 @@
 """Tests for the content curator agent."""
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -442,8 +443,7 @@ class TestCurateContent:
             summary="Found 1 highly relevant article about AI funding.",
         )
 
-        mock_agent_result = MagicMock()
-        mock_agent_result.output = mock_result_data
+        mock_agent_result = SimpleNamespace(output=mock_result_data)
 
         mock_agent = MagicMock()
         mock_agent.run = AsyncMock(return_value=mock_agent_result)
@@ -471,8 +471,7 @@ class TestCurateContent:
             summary="No relevant content found.",
         )
 
-        mock_agent_result = MagicMock()
-        mock_agent_result.output = mock_result_data
+        mock_agent_result = SimpleNamespace(output=mock_result_data)
 
         with patch("wintern.agents.curator.create_curator_agent") as mock_create:
             mock_agent = MagicMock()
@@ -505,8 +504,7 @@ class TestCurateContent:
 
         mock_result_data = CuratedContent(items=[], summary="No matches.")
 
-        mock_agent_result = MagicMock()
-        mock_agent_result.output = mock_result_data
+        mock_agent_result = SimpleNamespace(output=mock_result_data)
 
         mock_agent = MagicMock()
         mock_agent.run = AsyncMock(return_value=mock_agent_result)
@@ -1,13 +1,16 @@
 """Integration tests for execution API endpoints."""
 
+import asyncio
 import uuid
 
 import pytest
 from httpx import AsyncClient
 
+from wintern.core.exceptions import ErrorCode
 
-async def get_auth_token(client: AsyncClient, email: str) -> str:
-    """Helper to register and login, returning the access token."""
+
+async def get_auth_headers(client: AsyncClient, email: str) -> dict[str, str]:
+    """Helper to register and login, returning reusable Authorization headers."""
     await client.post(
         "/auth/register",
         json={"email": email, "password": "testpassword123"},
@@ -16,18 +19,19 @@ async def get_auth_token(client: AsyncClient, email: str) -> str:
         "/auth/login",
         data={"username": email, "password": "testpassword123"},
     )
-    return login_response.json()["access_token"]
+    token = login_response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
 
 
 async def create_wintern_with_configs(
     client: AsyncClient,
-    token: str,
+    headers: dict[str, str],
     name: str = "Test Wintern",
 ) -> dict:
     """Helper to create a wintern with source and delivery configs."""
     response = await client.post(
         "/v1/winterns",
-        headers={"Authorization": f"Bearer {token}"},
+        headers=headers,
         json={
             "name": name,
             "context": "I want to track AI developments",
@@ -56,12 +60,12 @@ class TestTriggerRunEndpoint:
     @pytest.mark.asyncio
     async def test_trigger_run_success(self, client: AsyncClient):
         """Should return 202 Accepted and queue the run."""
-        token = await get_auth_token(client, "trigger-run@example.com")
-        wintern = await create_wintern_with_configs(client, token)
+        headers = await get_auth_headers(client, "trigger-run@example.com")
+        wintern = await create_wintern_with_configs(client, headers)
 
         response = await client.post(
             f"/v1/winterns/{wintern['id']}/run",
-            headers={"Authorization": f"Bearer {token}"},
+            headers=headers,
         )
 
         assert response.status_code == 202
@@ -72,12 +76,12 @@ class TestTriggerRunEndpoint:
     @pytest.mark.asyncio
     async def test_trigger_run_not_found(self, client: AsyncClient):
         """Should return 404 for non-existent wintern."""
-        token = await get_auth_token(client, "trigger-404@example.com")
+        headers = await get_auth_headers(client, "trigger-404@example.com")
         fake_id = str(uuid.uuid4())
 
         response = await client.post(
             f"/v1/winterns/{fake_id}/run",
-            headers={"Authorization": f"Bearer {token}"},
+            headers=headers,
         )
 
         assert response.status_code == 404
@@ -85,12 +89,12 @@ class TestTriggerRunEndpoint:
     @pytest.mark.asyncio
     async def test_trigger_run_no_sources(self, client: AsyncClient):
         """Should return 400 when wintern has no active sources."""
-        token = await get_auth_token(client, "trigger-no-sources@example.com")
+        headers = await get_auth_headers(client, "trigger-no-sources@example.com")
 
         # Create wintern without sources
         response = await client.post(
             "/v1/winterns",
-            headers={"Authorization": f"Bearer {token}"},
+            headers=headers,
             json={
                 "name": "No Sources Wintern",
                 "context": "Test context",
@@ -103,21 +107,21 @@ class TestTriggerRunEndpoint:
 
         response = await client.post(
             f"/v1/winterns/{wintern['id']}/run",
-            headers={"Authorization": f"Bearer {token}"},
+            headers=headers,
         )
 
         assert response.status_code == 400
-        assert "sources" in response.json()["detail"].lower()
+        assert response.json()["error_code"] == ErrorCode.NO_ACTIVE_SOURCES
 
     @pytest.mark.asyncio
     async def test_trigger_run_no_delivery(self, client: AsyncClient):
         """Should return 400 when wintern has no active delivery channels."""
-        token = await get_auth_token(client, "trigger-no-delivery@example.com")
+        headers = await get_auth_headers(client, "trigger-no-delivery@example.com")
 
         # Create wintern without delivery configs
         response = await client.post(
             "/v1/winterns",
-            headers={"Authorization": f"Bearer {token}"},
+            headers=headers,
             json={
                 "name": "No Delivery Wintern",
                 "context": "Test context",
@@ -130,11 +134,11 @@ class TestTriggerRunEndpoint:
 
         response = await client.post(
             f"/v1/winterns/{wintern['id']}/run",
-            headers={"Authorization": f"Bearer {token}"},
+            headers=headers,
         )
 
         assert response.status_code == 400
-        assert "delivery" in response.json()["detail"].lower()
+        assert response.json()["error_code"] == ErrorCode.NO_ACTIVE_DELIVERIES
 
     @pytest.mark.asyncio
     async def test_trigger_run_unauthorized(self, client: AsyncClient):
@@ -148,15 +152,19 @@ class TestTriggerRunEndpoint:
     @pytest.mark.asyncio
     async def test_trigger_run_other_user(self, client: AsyncClient):
         """Should return 404 when trying to trigger another user's wintern."""
+        # The two users are independent, so authenticate them concurrently
+        headers1, headers2 = await asyncio.gather(
+            get_auth_headers(client, "trigger-user1@example.com"),
+            get_auth_headers(client, "trigger-user2@example.com"),
+        )
+
         # Create wintern as user 1
-        token1 = await get_auth_token(client, "trigger-user1@example.com")
-        wintern = await create_wintern_with_configs(client, token1)
+        wintern = await create_wintern_with_configs(client, headers1)
 
         # Try to trigger as user 2
-        token2 = await get_auth_token(client, "trigger-user2@example.com")
         response = await client.post(
             f"/v1/winterns/{wintern['id']}/run",
-            headers={"Authorization": f"Bearer {token2}"},
+            headers=headers2,
         )
 
         assert response.status_code == 404
@@ -168,12 +176,12 @@ class TestListRunsEndpoint:
     @pytest.mark.asyncio
     async def test_list_runs_empty(self, client: AsyncClient):
         """Should return empty list when no runs exist."""
-        token = await get_auth_token(client, "list-empty@example.com")
-        wintern = await create_wintern_with_configs(client, token)
+        headers = await get_auth_headers(client, "list-empty@example.com")
+        wintern = await create_wintern_with_configs(client, headers)
 
         response = await client.get(
             f"/v1/winterns/{wintern['id']}/runs",
-            headers={"Authorization": f"Bearer {token}"},
+            headers=headers,
         )
 
         assert response.status_code == 200
@@ -184,13 +192,13 @@ class TestListRunsEndpoint:
     @pytest.mark.asyncio
     async def test_list_runs_returns_correct_structure(self, client: AsyncClient):
         """Should return runs list with correct structure."""
-        token = await get_auth_token(client, "list-structure@example.com")
-        wintern = await create_wintern_with_configs(client, token)
+        headers = await get_auth_headers(client, "list-structure@example.com")
+        wintern = await create_wintern_with_configs(client, headers)
 
         # List runs (empty is fine, we're testing structure)
         response = await client.get(
             f"/v1/winterns/{wintern['id']}/runs",
-            headers={"Authorization": f"Bearer {token}"},
+            headers=headers,
         )
 
         assert response.status_code == 200
@@ -204,13 +212,13 @@ class TestListRunsEndpoint:
     @pytest.mark.asyncio
     async def test_list_runs_pagination_params(self, client: AsyncClient):
         """Should respect pagination parameters."""
-        token = await get_auth_token(client, "list-pagination@example.com")
-        wintern = await create_wintern_with_configs(client, token)
+        headers = await get_auth_headers(client, "list-pagination@example.com")
+        wintern = await create_wintern_with_configs(client, headers)
 
         # Get with specific pagination params
         response = await client.get(
             f"/v1/winterns/{wintern['id']}/runs?skip=5&limit=10",
-            headers={"Authorization": f"Bearer {token}"},
+            headers=headers,
         )
 
         assert response.status_code == 200
@@ -221,12 +229,12 @@ class TestListRunsEndpoint:
     @pytest.mark.asyncio
     async def test_list_runs_not_found(self, client: AsyncClient):
         """Should return 404 for non-existent wintern."""
-        token = await get_auth_token(client, "list-404@example.com")
+        headers = await get_auth_headers(client, "list-404@example.com")
         fake_id = str(uuid.uuid4())
 
         response = await client.get(
             f"/v1/winterns/{fake_id}/runs",
-            headers={"Authorization": f"Bearer {token}"},
+            headers=headers,
         )
 
         assert response.status_code == 404
@@ -247,13 +255,13 @@ class TestGetRunEndpoint:
     @pytest.mark.asyncio
     async def test_trigger_returns_correct_response_fields(self, client: AsyncClient):
         """Should return trigger response with wintern_id and message."""
-        token = await get_auth_token(client, "get-run@example.com")
-        wintern = await create_wintern_with_configs(client, token)
+        headers = await get_auth_headers(client, "get-run@example.com")
+        wintern = await create_wintern_with_configs(client, headers)
 
         # Trigger a run - the trigger response includes wintern_id and message
         trigger_response = await client.post(
             f"/v1/winterns/{wintern['id']}/run",
-            headers={"Authorization": f"Bearer {token}"},
+            headers=headers,
         )
         trigger_data = trigger_response.json()
 
@@ -266,13 +274,13 @@ class TestGetRunEndpoint:
     @pytest.mark.asyncio
     async def test_get_run_not_found(self, client: AsyncClient):
         """Should return 404 for non-existent run."""
-        token = await get_auth_token(client, "get-run-404@example.com")
-        wintern = await create_wintern_with_configs(client, token)
+        headers = await get_auth_headers(client, "get-run-404@example.com")
+        wintern = await create_wintern_with_configs(client, headers)
         fake_run_id = str(uuid.uuid4())
 
         response = await client.get(
             f"/v1/winterns/{wintern['id']}/runs/{fake_run_id}",
-            headers={"Authorization": f"Bearer {token}"},
+            headers=headers,
         )
 
         assert response.status_code == 404
@@ -280,13 +288,13 @@ class TestGetRunEndpoint:
     @pytest.mark.asyncio
     async def test_get_run_wintern_not_found(self, client: AsyncClient):
         """Should return 404 for non-existent wintern."""
-        token = await get_auth_token(client, "get-run-wintern-404@example.com")
+        headers = await get_auth_headers(client, "get-run-wintern-404@example.com")
         fake_wintern_id = str(uuid.uuid4())
         fake_run_id = str(uuid.uuid4())
 
         response = await client.get(
             f"/v1/winterns/{fake_wintern_id}/runs/{fake_run_id}",
-            headers={"Authorization": f"Bearer {token}"},
+            headers=headers,
         )
 
         assert response.status_code == 404
@@ -294,10 +302,10 @@ class TestGetRunEndpoint:
     @pytest.mark.asyncio
     async def test_get_run_wrong_wintern(self, client: AsyncClient):
         """Should return 404 if trying to access run with wrong wintern ID."""
-        token = await get_auth_token(client, "get-run-wrong@example.com")
+        headers = await get_auth_headers(client, "get-run-wrong@example.com")
 
         # Create a wintern
-        wintern = await create_wintern_with_configs(client, token, "Test Wintern")
+        wintern = await create_wintern_with_configs(client, headers, "Test Wintern")
 
         # Use a fake run_id that doesn't exist
         fake_run_id = str(uuid.uuid4())
@@ -305,7 +313,7 @@ class TestGetRunEndpoint:
         # Try to get a non-existent run
         response = await client.get(
             f"/v1/winterns/{wintern['id']}/runs/{fake_run_id}",
-            headers={"Authorization": f"Bearer {token}"},
+            headers=headers,
         )
 
         assert response.status_code == 404
@@ -327,12 +335,12 @@ class TestRunResponseSchema:
     @pytest.mark.asyncio
     async def test_trigger_response_schema(self, client: AsyncClient):
         """Should include all expected fields in trigger response."""
-        token = await get_auth_token(client, "schema-test@example.com")
-        wintern = await create_wintern_with_configs(client, token)
+        headers = await get_auth_headers(client, "schema-test@example.com")
+        wintern = await create_wintern_with_configs(client, headers)
 
         response = await client.post(
             f"/v1/winterns/{wintern['id']}/run",
-            headers={"Authorization": f"Bearer {token}"},
+            headers=headers,
         )
 
         assert response.status_code == 202
@@ -350,12 +358,12 @@ class TestRunResponseSchema:
     @pytest.mark.asyncio
     async def test_list_response_schema(self, client: AsyncClient):
         """Should include all expected fields in list response."""
-        token = await get_auth_token(client, "list-schema@example.com")
-        wintern = await create_wintern_with_configs(client, token)
+        headers = await get_auth_headers(client, "list-schema@example.com")
+        wintern = await create_wintern_with_configs(client, headers)
 
         response = await client.get(
             f"/v1/winterns/{wintern['id']}/runs",
-            headers={"Authorization": f"Bearer {token}"},
+            headers=headers,
         )
 
         assert response.status_code == 200
@@ -4,18 +4,29 @@ import uuid
 from datetime import UTC, datetime, timedelta
 
 import pytest
+import pytest_asyncio
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from wintern.auth.models import User
 from wintern.execution import service as execution_service
-from wintern.execution.models import RunStatus
+from wintern.execution.models import RunStatus, WinternRun
 from wintern.winterns.models import DeliveryConfig, DeliveryType, SourceConfig, SourceType, Wintern
 
 
+async def _bulk_create_runs_for_test(
+    session: AsyncSession, wintern_id: uuid.UUID, n: int
+) -> list[WinternRun]:
+    """Insert n PENDING runs for a wintern with a single flush."""
+    runs = [WinternRun(wintern_id=wintern_id, status=RunStatus.PENDING) for _ in range(n)]
+    session.add_all(runs)
+    await session.flush()
+    return runs
+
+
 @pytest.fixture
 async def test_user(test_session: AsyncSession):
     """Create a test user."""
-    from wintern.auth.models import User
-
     user = User(
         id=uuid.uuid4(),
         email="test@example.com",
@@ -53,8 +64,6 @@ async def test_wintern_with_configs(test_session: AsyncSession, test_user):
         cron_schedule="0 9 * * *",
         is_active=True,
     )
-    test_session.add(wintern)
-    await test_session.flush()
 
     source = SourceConfig(
         wintern_id=wintern.id,
@@ -62,7 +71,6 @@ async def test_wintern_with_configs(test_session: AsyncSession, test_user):
         config={},
         is_active=True,
     )
-    test_session.add(source)
 
     delivery = DeliveryConfig(
         wintern_id=wintern.id,
@@ -70,11 +78,32 @@ async def test_wintern_with_configs(test_session: AsyncSession, test_user):
         config={"webhook_url": "https://hooks.slack.com/test"},
         is_active=True,
     )
-    test_session.add(delivery)
+    test_session.add_all([wintern, source, delivery])
     await test_session.flush()
     return wintern
 
 
+@pytest_asyncio.fixture(scope="module")
+async def shared_wintern(module_session: AsyncSession):
+    """Create a single test wintern (and its owner) shared by the module."""
+    user = User(
+        id=uuid.uuid4(),
+        email="shared@example.com",
+        hashed_password="hashedpassword",
+    )
+    wintern = Wintern(
+        id=uuid.uuid4(),
+        user_id=user.id,
+        name="Shared Test Wintern",
+        context="Test research context",
+        cron_schedule="0 9 * * *",
+        is_active=True,
+    )
+    module_session.add_all([user, wintern])
+    await module_session.flush()
+    return wintern
+
+
 class TestContentHashComputation:
     """Tests for compute_content_hash."""
 
@@ -85,7 +114,8 @@ class TestContentHashComputation:
 
         assert isinstance(hash_result, str)
         assert len(hash_result) == 64
-        assert all(c in "0123456789abcdef" for c in hash_result)
+        assert hash_result.islower()
+        assert len(bytes.fromhex(hash_result)) == 32
 
     def test_compute_hash_deterministic(self):
         """Same URL should produce same hash."""
@@ -107,23 +137,27 @@ class TestContentHashComputation:
 
 
 class TestRunLifecycle:
-    """Tests for run creation and status updates."""
+    """Tests for run creation and status updates.
+
+    The wintern is inserted once for the module; the runs each test creates
+    are rolled back with its ``test_session`` SAVEPOINT.
+    """
 
     @pytest.mark.asyncio
-    async def test_create_run(self, test_session: AsyncSession, test_wintern):
+    async def test_create_run(self, test_session: AsyncSession, shared_wintern):
         """Should create a run in PENDING status."""
-        run = await execution_service.create_run(test_session, test_wintern.id)
+        run = await execution_service.create_run(test_session, shared_wintern.id)
 
         assert run.id is not None
-        assert run.wintern_id == test_wintern.id
+        assert run.wintern_id == shared_wintern.id
         assert run.status == RunStatus.PENDING
         assert run.started_at is None
         assert run.completed_at is None
 
     @pytest.mark.asyncio
-    async def test_start_run(self, test_session: AsyncSession, test_wintern):
+    async def test_start_run(self, test_session: AsyncSession, shared_wintern):
         """Should mark run as RUNNING with start time."""
-        run = await execution_service.create_run(test_session, test_wintern.id)
+        run = await execution_service.create_run(test_session, shared_wintern.id)
         started_run = await execution_service.start_run(test_session, run)
 
         assert started_run.status == RunStatus.RUNNING
@@ -131,9 +165,9 @@ class TestRunLifecycle:
         assert started_run.completed_at is None
 
     @pytest.mark.asyncio
-    async def test_complete_run(self, test_session: AsyncSession, test_wintern):
+    async def test_complete_run(self, test_session: AsyncSession, shared_wintern):
         """Should mark run as COMPLETED with digest and metadata."""
-        run = await execution_service.create_run(test_session, test_wintern.id)
+        run = await execution_service.create_run(test_session, shared_wintern.id)
         await execution_service.start_run(test_session, run)
 
         digest = "Test digest content"
@@ -149,9 +183,9 @@ class TestRunLifecycle:
         assert completed_run.metadata_ == metadata
 
     @pytest.mark.asyncio
-    async def test_fail_run(self, test_session: AsyncSession, test_wintern):
+    async def test_fail_run(self, test_session: AsyncSession, shared_wintern):
         """Should mark run as FAILED with error message."""
-        run = await execution_service.create_run(test_session, test_wintern.id)
+        run = await execution_service.create_run(test_session, shared_wintern.id)
         await execution_service.start_run(test_session, run)
 
         error_message = "Test error"
@@ -209,8 +243,7 @@ class TestRunQueries:
     async def test_list_runs_for_wintern(self, test_session: AsyncSession, test_wintern):
         """Should list runs for a wintern with pagination."""
         # Create multiple runs
-        for _ in range(5):
-            await execution_service.create_run(test_session, test_wintern.id)
+        await _bulk_create_runs_for_test(test_session, test_wintern.id, 5)
 
         runs, total = await execution_service.list_runs_for_wintern(
             test_session, test_wintern.id, skip=0, limit=3
@@ -339,6 +372,47 @@ class TestSchedulingOperations:
         assert len(due) == 1
         assert due[0].id == test_wintern.id
 
+    @pytest.mark.asyncio
+    async def test_get_due_winterns_single_query(self, test_session: AsyncSession, test_user):
+        """Should load any number of due winterns in one query."""
+        now = datetime.now(UTC)
+        due_winterns = [
+            Wintern(
+                user_id=test_user.id,
+                name=f"Due Wintern {i}",
+                context="Test context",
+                cron_schedule="0 9 * * *",
+                next_run_at=now - timedelta(hours=1),
+                is_active=True,
+            )
+            for i in range(10)
+        ]
+        not_due = Wintern(
+            user_id=test_user.id,
+            name="Not Due Wintern",
+            context="Test context",
+            cron_schedule="0 9 * * *",
+            next_run_at=now + timedelta(hours=1),
+            is_active=True,
+        )
+        test_session.add_all([*due_winterns, not_due])
+        await test_session.flush()
+
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = test_session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            due = await execution_service.get_due_winterns(test_session)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert {w.id for w in due} == {w.id for w in due_winterns}
+        assert len(statements) == 1
+
     @pytest.mark.asyncio
     async def test_get_due_winterns_excludes_inactive(
         self, test_session: AsyncSession, test_wintern
@@ -352,6 +426,79 @@ class TestSchedulingOperations:
 
         assert due == []
 
+    @pytest.mark.asyncio
+    async def test_claim_wintern_run_only_once(self, test_session: AsyncSession, test_wintern):
+        """Only the first claim for the same due run should succeed."""
+        test_wintern.next_run_at = datetime.now(UTC) - timedelta(minutes=5)
+        await test_session.flush()
+
+        first = await execution_service.claim_wintern_run(test_session, test_wintern)
+        second = await execution_service.claim_wintern_run(test_session, test_wintern)
+
+        assert first is True
+        assert second is False
+
+    @pytest.mark.asyncio
+    async def test_claim_wintern_run_schedules_from_as_of(
+        self, test_session: AsyncSession, test_wintern
+    ):
+        """The claimed run's next_run_at should be computed from the given instant."""
+        as_of = datetime(2024, 1, 1, 12, 0, tzinfo=UTC)
+        test_wintern.next_run_at = as_of - timedelta(minutes=5)
+        await test_session.flush()
+
+        claimed = await execution_service.claim_wintern_run(test_session, test_wintern, as_of=as_of)
+
+        assert claimed is True
+        await test_session.refresh(test_wintern)
+        next_run_at = test_wintern.next_run_at
+        assert next_run_at is not None
+        # 9am daily, from noon on Jan 1st
+        assert next_run_at.replace(tzinfo=UTC) == datetime(2024, 1, 2, 9, 0, tzinfo=UTC)
+
+    @pytest.mark.asyncio
+    async def test_get_earliest_next_run_at(self, test_session: AsyncSession, test_wintern):
+        """Should return the soonest next_run_at among active winterns."""
+        earliest = datetime(2000, 1, 1, tzinfo=UTC)
+        test_wintern.next_run_at = earliest
+        await test_session.flush()
+
+        next_run_at = await execution_service.get_earliest_next_run_at(test_session)
+
+        assert next_run_at == earliest
+
+    @pytest.mark.asyncio
+    async def test_get_earliest_next_run_at_excludes_inactive(
+        self, test_session: AsyncSession, test_wintern
+    ):
+        """Should ignore inactive winterns."""
+        earliest = datetime(2000, 1, 1, tzinfo=UTC)
+        test_wintern.next_run_at = earliest
+        test_wintern.is_active = False
+        await test_session.flush()
+
+        next_run_at = await execution_service.get_earliest_next_run_at(test_session)
+
+        assert next_run_at is None
+
+    def test_notify_next_run_at_forwards_to_listener(self, monkeypatch):
+        """Should pass scheduled run times to the registered listener only."""
+        calls: list[datetime] = []
+        monkeypatch.setattr(execution_service, "_next_run_listener", calls.append)
+        run_at = datetime(2000, 1, 1, tzinfo=UTC)
+
+        execution_service.notify_next_run_at(run_at)
+        execution_service.notify_next_run_at(None)
+
+        assert calls == [run_at]
+
+    def test_notify_next_run_at_without_listener(self, monkeypatch):
+        """Should do nothing when no scheduler has registered a listener."""
+        monkeypatch.setattr(execution_service, "_next_run_listener", None)
+
+        # Should not raise
+        execution_service.notify_next_run_at(datetime.now(UTC))
+
     @pytest.mark.asyncio
     async def test_update_next_run_at(self, test_session: AsyncSession, test_wintern):
         """Should update next_run_at based on cron schedule."""
@@ -18,63 +18,70 @@ from wintern.sources.reddit import RedditSource
 from wintern.winterns.models import DeliveryConfig, DeliveryType, SourceConfig, SourceType
 
 
-class TestCreateDataSource:
-    """Tests for create_data_source factory function."""
-
-    def test_create_brave_search_source(self):
-        """Should create BraveSearchSource for BRAVE_SEARCH type."""
-        config = SourceConfig(
-            id=uuid.uuid4(),
-            wintern_id=uuid.uuid4(),
-            source_type=SourceType.BRAVE_SEARCH,
-            config={},
-            is_active=True,
-        )
+@pytest.fixture(
+    scope="module",
+    params=[
+        (SourceType.BRAVE_SEARCH, {}, BraveSearchSource, "brave_search"),
+        (SourceType.REDDIT, {"subreddits": ["python"]}, RedditSource, "reddit"),
+    ],
+    ids=lambda case: case[3],
+)
+def source_case(request: pytest.FixtureRequest) -> tuple[SourceConfig, type[DataSource], str]:
+    """Build each supported source config once, with its expected class and name."""
+    source_type, config, expected_cls, name = request.param
+    source_config = SourceConfig(
+        id=uuid.uuid4(),
+        wintern_id=uuid.uuid4(),
+        source_type=source_type,
+        config=config,
+        is_active=True,
+    )
+    return source_config, expected_cls, name
+
+
+@pytest.fixture(
+    scope="module",
+    params=[(DeliveryType.SLACK, {}, SlackDelivery, "slack")],
+    ids=lambda case: case[3],
+)
+def delivery_case(
+    request: pytest.FixtureRequest,
+) -> tuple[DeliveryConfig, type[DeliveryChannel], str]:
+    """Build each supported delivery config once, with its expected class and name."""
+    delivery_type, config, expected_cls, name = request.param
+    delivery_config = DeliveryConfig(
+        id=uuid.uuid4(),
+        wintern_id=uuid.uuid4(),
+        delivery_type=delivery_type,
+        config=config,
+        is_active=True,
+    )
+    return delivery_config, expected_cls, name
 
-        source = create_data_source(config)
 
-        assert isinstance(source, DataSource)
-        assert isinstance(source, BraveSearchSource)
-        assert source.source_name == "brave_search"
+class TestCreateDataSource:
+    """Tests for create_data_source factory function."""
 
-    def test_create_reddit_source(self):
-        """Should create RedditSource for REDDIT type."""
-        config = SourceConfig(
-            id=uuid.uuid4(),
-            wintern_id=uuid.uuid4(),
-            source_type=SourceType.REDDIT,
-            config={"subreddits": ["python"]},
-            is_active=True,
-        )
+    def test_create_source(self, source_case: tuple[SourceConfig, type[DataSource], str]):
+        """Should create the matching DataSource for each supported type."""
+        config, expected_cls, name = source_case
 
         source = create_data_source(config)
 
         assert isinstance(source, DataSource)
-        assert isinstance(source, RedditSource)
-        assert source.source_name == "reddit"
-
-    def test_create_rss_source_unsupported(self):
-        """Should raise UnsupportedSourceError for RSS type."""
-        config = SourceConfig(
-            id=uuid.uuid4(),
-            wintern_id=uuid.uuid4(),
-            source_type=SourceType.RSS,
-            config={},
-            is_active=True,
-        )
-
-        with pytest.raises(UnsupportedSourceError) as exc_info:
-            create_data_source(config)
-
-        assert exc_info.value.source_type == SourceType.RSS
-        assert "rss" in str(exc_info.value).lower()
-
-    def test_create_news_api_source_unsupported(self):
-        """Should raise UnsupportedSourceError for NEWS_API type."""
+        assert isinstance(source, expected_cls)
+        assert source.source_name == name
+
+    @pytest.mark.parametrize(
+        ("source_type", "name"),
+        [(SourceType.RSS, "rss"), (SourceType.NEWS_API, "news_api")],
+    )
+    def test_create_source_unsupported(self, source_type: SourceType, name: str):
+        """Should raise UnsupportedSourceError for source types not yet implemented."""
         config = SourceConfig(
             id=uuid.uuid4(),
             wintern_id=uuid.uuid4(),
-            source_type=SourceType.NEWS_API,
+            source_type=source_type,
             config={},
             is_active=True,
         )
@@ -82,28 +89,24 @@ class TestCreateDataSource:
         with pytest.raises(UnsupportedSourceError) as exc_info:
             create_data_source(config)
 
-        assert exc_info.value.source_type == SourceType.NEWS_API
-        assert "news_api" in str(exc_info.value).lower()
+        assert exc_info.value.source_type == source_type
+        assert name in str(exc_info.value).lower()
 
 
 class TestCreateDeliveryChannel:
     """Tests for create_delivery_channel factory function."""
 
-    def test_create_slack_delivery(self):
-        """Should create SlackDelivery for SLACK type."""
-        config = DeliveryConfig(
-            id=uuid.uuid4(),
-            wintern_id=uuid.uuid4(),
-            delivery_type=DeliveryType.SLACK,
-            config={},
-            is_active=True,
-        )
+    def test_create_delivery(
+        self, delivery_case: tuple[DeliveryConfig, type[DeliveryChannel], str]
+    ):
+        """Should create the matching DeliveryChannel for each supported type."""
+        config, expected_cls, name = delivery_case
 
         channel = create_delivery_channel(config)
 
         assert isinstance(channel, DeliveryChannel)
-        assert isinstance(channel, SlackDelivery)
-        assert channel.channel_name == "slack"
+        assert isinstance(channel, expected_cls)
+        assert channel.channel_name == name
 
     def test_create_slack_delivery_with_webhook(self):
         """Should create SlackDelivery with custom webhook URL."""
@@ -121,37 +124,30 @@ class TestCreateDeliveryChannel:
         assert isinstance(channel, SlackDelivery)
         assert channel._webhook_url == webhook_url
 
-    def test_create_email_delivery_unsupported(self):
-        """Should raise UnsupportedDeliveryError for EMAIL type."""
-        config = DeliveryConfig(
-            id=uuid.uuid4(),
-            wintern_id=uuid.uuid4(),
-            delivery_type=DeliveryType.EMAIL,
-            config={"to": "user@example.com"},
-            is_active=True,
-        )
-
-        with pytest.raises(UnsupportedDeliveryError) as exc_info:
-            create_delivery_channel(config)
-
-        assert exc_info.value.delivery_type == DeliveryType.EMAIL
-        assert "email" in str(exc_info.value).lower()
-
-    def test_create_sms_delivery_unsupported(self):
-        """Should raise UnsupportedDeliveryError for SMS type."""
-        config = DeliveryConfig(
+    @pytest.mark.parametrize(
+        ("delivery_type", "config", "name"),
+        [
+            (DeliveryType.EMAIL, {"to": "user@example.com"}, "email"),
+            (DeliveryType.SMS, {"phone": "+1234567890"}, "sms"),
+        ],
+    )
+    def test_create_delivery_unsupported(
+        self, delivery_type: DeliveryType, config: dict, name: str
+    ):
+        """Should raise UnsupportedDeliveryError for delivery types not yet implemented."""
+        delivery_config = DeliveryConfig(
             id=uuid.uuid4(),
             wintern_id=uuid.uuid4(),
-            delivery_type=DeliveryType.SMS,
-            config={"phone": "+1234567890"},
+            delivery_type=delivery_type,
+            config=config,
             is_active=True,
         )
 
         with pytest.raises(UnsupportedDeliveryError) as exc_info:
-            create_delivery_channel(config)
+            create_delivery_channel(delivery_config)
 
-        assert exc_info.value.delivery_type == DeliveryType.SMS
-        assert "sms" in str(exc_info.value).lower()
+        assert exc_info.value.delivery_type == delivery_type
+        assert name in str(exc_info.value).lower()
 
 
 class TestExceptionMessages:
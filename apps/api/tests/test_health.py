@@ -1,15 +1,36 @@
 """Tests for health endpoint."""
 
+import pytest
 from fastapi.testclient import TestClient
 
-from wintern.main import app
+from wintern.core.config import settings
+from wintern.main import app, health_check
 
-client = TestClient(app)
 
+@pytest.fixture(scope="module")
+def test_client() -> TestClient:
+    """Create a test client shared by the module.
 
-def test_health_endpoint():
-    """Test that health endpoint returns healthy status."""
-    response = client.get("/health")
+    Not entered as a context manager, so the app lifespan (and with it the
+    scheduler) does not run.
+    """
+    return TestClient(app)
+
+
+@pytest.mark.asyncio
+async def test_health_check():
+    """Test that the health handler reports status, version, and environment."""
+    data = await health_check()
+    assert data == {
+        "status": "healthy",
+        "version": settings.version,
+        "environment": settings.environment,
+    }
+
+
+def test_health_endpoint(test_client: TestClient):
+    """Test that health endpoint returns healthy status over HTTP."""
+    response = test_client.get("/health")
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "healthy"
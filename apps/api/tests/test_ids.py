@@ -0,0 +1,31 @@
+"""Tests for time-ordered primary key generation."""
+
+import time
+import uuid
+
+from wintern.core.ids import new_id
+
+
+def test_new_id_is_uuid7():
+    """Should produce RFC 9562 version 7 UUIDs."""
+    value = new_id()
+
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_new_id_embeds_current_time():
+    """The leading 48 bits should be the current Unix time in milliseconds."""
+    before = time.time_ns() // 1_000_000
+    value = new_id()
+    after = time.time_ns() // 1_000_000
+
+    assert before <= value.int >> 80 <= after + 1
+
+
+def test_ids_are_time_ordered():
+    """Ids generated in sequence should sort in generation order."""
+    ids = [new_id() for _ in range(10_000)]
+
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
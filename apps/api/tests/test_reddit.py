@@ -1,10 +1,17 @@
 """Tests for Reddit data source using AsyncPRAW."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import copy
+from collections.abc import AsyncIterator, Callable, Iterable, Mapping
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
 from asyncprawcore.exceptions import Forbidden, NotFound, ResponseException
 
+from wintern.core.config import Settings, settings
+from wintern.sources import reddit
 from wintern.sources.reddit import (
     RedditAPIError,
     RedditAuthError,
@@ -12,480 +19,578 @@ from wintern.sources.reddit import (
     RedditError,
     RedditSource,
     _create_reddit_client,
+    _parse_created_utc,
+    _parse_created_utc_cached,
     _submission_to_search_result,
+    _subreddit_name,
     search_reddit,
+    shutdown_reddit,
 )
 
+# Response stand-in passed to asyncprawcore exceptions; their message is never asserted on.
+_EXC_ARG = MagicMock()
 
-class TestCreateRedditClient:
-    """Tests for _create_reddit_client helper."""
-
-    def test_missing_client_id(self) -> None:
-        """Test error when client_id is missing."""
-        with patch("wintern.sources.reddit.settings") as mock_settings:
-            mock_settings.reddit_client_id = ""
-            mock_settings.reddit_client_secret = "secret"
-
-            with pytest.raises(
-                RedditCredentialsMissingError,
-                match="REDDIT_CLIENT_ID and REDDIT_CLIENT_SECRET",
-            ):
-                _create_reddit_client()
-
-    def test_missing_client_secret(self) -> None:
-        """Test error when client_secret is missing."""
-        with patch("wintern.sources.reddit.settings") as mock_settings:
-            mock_settings.reddit_client_id = "client_id"
-            mock_settings.reddit_client_secret = ""
-
-            with pytest.raises(
-                RedditCredentialsMissingError,
-                match="REDDIT_CLIENT_ID and REDDIT_CLIENT_SECRET",
-            ):
-                _create_reddit_client()
-
-    def test_creates_client_with_credentials(self) -> None:
-        """Test client is created with proper credentials."""
-        with (
-            patch("wintern.sources.reddit.settings") as mock_settings,
-            patch("wintern.sources.reddit.asyncpraw.Reddit") as mock_reddit,
+# created_utc of the shared mock submission, 1704067200.0
+_EXPECTED_DT = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+async def _async_none(*args: Any, **kwargs: Any) -> None:
+    return None
+
+
+async def _raise_forbidden(*args: Any, **kwargs: Any) -> None:
+    raise Forbidden(_EXC_ARG)
+
+
+def make_search_gen(
+    items: Iterable[Any] = (), assert_limit: int | None = None
+) -> Callable[..., AsyncIterator[Any]]:
+    """Build a ``subreddit.search`` replacement yielding ``items``.
+
+    When ``assert_limit`` is given, the generator also checks the ``limit``
+    search_reddit passed through.
+    """
+
+    async def gen(*args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+        if assert_limit is not None:
+            assert kwargs.get("limit") == assert_limit
+        for item in items:
+            yield item
+
+    return gen
+
+
+class FakeReddit:
+    """Minimal stand-in for ``asyncpraw.Reddit`` recording how the client was used."""
+
+    def __init__(
+        self,
+        subreddit: Any = None,
+        *,
+        subreddit_side_effect: BaseException | None = None,
+        failing_names: Iterable[str] | None = None,
+        by_name: Mapping[str, Any] | None = None,
+        user: Any = None,
+    ) -> None:
+        self.sub = subreddit
+        # Per-name subreddits, overriding subreddit for the names it holds
+        self.by_name = by_name or {}
+        self.side_effect = subreddit_side_effect
+        # Subreddit names that raise side_effect; None means every name does
+        self.failing_names = None if failing_names is None else frozenset(failing_names)
+        self.user = user
+        self.names: list[str] = []
+        self.last_name: str | None = None
+        self.closed = False
+
+    async def subreddit(self, name: str) -> Any:
+        self.names.append(name)
+        self.last_name = name
+        if self.side_effect is not None and (
+            self.failing_names is None or name in self.failing_names
         ):
-            mock_settings.reddit_client_id = "test_id"
-            mock_settings.reddit_client_secret = "test_secret"
-            mock_settings.reddit_user_agent = "test_agent"
+            raise self.side_effect
+        return self.by_name.get(name, self.sub)
 
-            _create_reddit_client()
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def reddit_settings(monkeypatch: pytest.MonkeyPatch) -> Settings:
+    """Give every test valid Reddit credentials on the shared settings object.
+
+    Tests override a single field with ``monkeypatch.setattr`` on the returned
+    settings; monkeypatch restores the real values afterwards.
+    """
+    monkeypatch.setattr(settings, "reddit_client_id", "test_id")
+    monkeypatch.setattr(settings, "reddit_client_secret", "test_secret")
+    monkeypatch.setattr(settings, "reddit_user_agent", "test_agent")
+    return settings
+
+
+@pytest.fixture(autouse=True)
+def _reset_default_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start every test without a shared Reddit client."""
+    monkeypatch.setattr(reddit, "_default_client", None)
+
+
+InstallClient = Callable[[FakeReddit], FakeReddit]
+
+
+@pytest.fixture
+def patched_client(monkeypatch: pytest.MonkeyPatch) -> InstallClient:
+    """Return an installer that makes ``_create_reddit_client`` hand back a fake."""
+
+    def _install(client: FakeReddit) -> FakeReddit:
+        monkeypatch.setattr(reddit, "_create_reddit_client", lambda: client)
+        return client
+
+    return _install
+
+
+@pytest.fixture(scope="session")
+def source() -> RedditSource:
+    """Share one RedditSource; it holds no per-test state."""
+    return RedditSource()
+
+
+@pytest.fixture(scope="session")
+def base_submission() -> MagicMock:
+    """Build one fully populated mock submission for the whole session.
+
+    Tests take a shallow copy via the ``submission`` fixture and override only
+    the attributes they care about.
+    """
+    submission = MagicMock()
+    submission.title = "Test Title"
+    submission.selftext = "Test content here"
+    submission.permalink = "/r/test/comments/abc123/test_title/"
+    submission.subreddit = "test"
+    submission.author = "testuser"
+    submission.score = 100
+    submission.num_comments = 50
+    submission.is_self = True
+    submission.domain = "self.test"
+    submission.created_utc = 1704067200.0  # 2024-01-01 00:00:00 UTC
+    submission.removed_by_category = None
+    submission.banned_by = None
+    submission.removal_reason = None
+    return submission
+
+
+@pytest.fixture
+def submission(base_submission: MagicMock) -> MagicMock:
+    """Return a per-test copy of the shared mock submission."""
+    return copy.copy(base_submission)
+
+
+def test_missing_client_id(monkeypatch: pytest.MonkeyPatch, reddit_settings: Settings) -> None:
+    """Test error when client_id is missing."""
+    monkeypatch.setattr(reddit_settings, "reddit_client_id", "")
+
+    with pytest.raises(
+        RedditCredentialsMissingError,
+        match="REDDIT_CLIENT_ID and REDDIT_CLIENT_SECRET",
+    ):
+        _create_reddit_client()
+
+
+def test_missing_client_secret(monkeypatch: pytest.MonkeyPatch, reddit_settings: Settings) -> None:
+    """Test error when client_secret is missing."""
+    monkeypatch.setattr(reddit_settings, "reddit_client_secret", "")
+
+    with pytest.raises(
+        RedditCredentialsMissingError,
+        match="REDDIT_CLIENT_ID and REDDIT_CLIENT_SECRET",
+    ):
+        _create_reddit_client()
+
+
+def test_creates_client_with_credentials(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test client is created with proper credentials."""
+    mock_reddit = MagicMock()
+    monkeypatch.setattr(reddit.asyncpraw, "Reddit", mock_reddit)
+
+    _create_reddit_client()
+
+    mock_reddit.assert_called_once_with(
+        client_id="test_id",
+        client_secret="test_secret",
+        user_agent="test_agent",
+    )
+
+
+def test_converts_submission(submission: MagicMock) -> None:
+    """Test converting a submission to SearchResult."""
+    result = _submission_to_search_result(submission)
+
+    assert result.title == "Test Title"
+    assert result.snippet == "Test content here"
+    assert result.url == "https://www.reddit.com/r/test/comments/abc123/test_title/"
+    assert result.source == "reddit"
+    assert result.metadata["subreddit"] == "test"
+    assert result.metadata["author"] == "testuser"
+    assert result.metadata["score"] == 100
+    assert result.published_at == _EXPECTED_DT
+
+
+def test_handles_deleted_author(submission: MagicMock) -> None:
+    """Test handling deleted author."""
+    submission.author = None
+    submission.created_utc = None
+
+    result = _submission_to_search_result(submission)
+
+    assert result.metadata["author"] == "[deleted]"
+    assert result.published_at is None
+
+
+def test_uses_title_as_snippet_when_no_selftext(submission: MagicMock) -> None:
+    """Test using title as snippet when selftext is empty."""
+    submission.title = "This is the title"
+    submission.selftext = ""
+
+    result = _submission_to_search_result(submission)
+
+    assert result.snippet == "This is the title"
+
+
+def test_parse_created_utc() -> None:
+    """Test timestamp parsing handles valid, missing and out-of-range values."""
+    assert _parse_created_utc(1704067200.0) == _EXPECTED_DT
+    assert _parse_created_utc(None) is None
+    assert _parse_created_utc(1e20) is None
 
-            mock_reddit.assert_called_once_with(
-                client_id="test_id",
-                client_secret="test_secret",
-                user_agent="test_agent",
-            )
 
+def test_parse_repeated_timestamp_cached() -> None:
+    """Test a repeated timestamp is served from the cache."""
+    _parse_created_utc_cached.cache_clear()
 
-class TestSubmissionToSearchResult:
-    """Tests for _submission_to_search_result helper."""
-
-    def test_converts_submission(self) -> None:
-        """Test converting a submission to SearchResult."""
-        submission = MagicMock()
-        submission.title = "Test Title"
-        submission.selftext = "Test content here"
-        submission.permalink = "/r/test/comments/abc123/test_title/"
-        submission.subreddit = MagicMock(__str__=lambda s: "test")
-        submission.author = MagicMock(__str__=lambda s: "testuser")
-        submission.score = 100
-        submission.num_comments = 50
-        submission.is_self = True
-        submission.domain = "self.test"
-        submission.created_utc = 1704067200.0  # 2024-01-01 00:00:00 UTC
-
-        result = _submission_to_search_result(submission)
-
-        assert result.title == "Test Title"
-        assert result.snippet == "Test content here"
-        assert result.url == "https://www.reddit.com/r/test/comments/abc123/test_title/"
-        assert result.source == "reddit"
-        assert result.metadata["subreddit"] == "test"
-        assert result.metadata["author"] == "testuser"
-        assert result.metadata["score"] == 100
-        assert result.published_at is not None
-        assert result.published_at.year == 2024
-
-    def test_handles_deleted_author(self) -> None:
-        """Test handling deleted author."""
-        submission = MagicMock()
-        submission.title = "Test"
-        submission.selftext = ""
-        submission.permalink = "/r/test/comments/abc/"
-        submission.subreddit = MagicMock(__str__=lambda s: "test")
-        submission.author = None
-        submission.score = 0
-        submission.num_comments = 0
-        submission.is_self = True
-        submission.created_utc = None
-
-        result = _submission_to_search_result(submission)
-
-        assert result.metadata["author"] == "[deleted]"
-        assert result.published_at is None
-
-    def test_uses_title_as_snippet_when_no_selftext(self) -> None:
-        """Test using title as snippet when selftext is empty."""
-        submission = MagicMock()
-        submission.title = "This is the title"
-        submission.selftext = ""
-        submission.permalink = "/r/test/comments/abc/"
-        submission.subreddit = MagicMock(__str__=lambda s: "test")
-        submission.author = MagicMock(__str__=lambda s: "user")
-        submission.score = 0
-        submission.num_comments = 0
-        submission.is_self = False
-        submission.domain = "example.com"
-        submission.created_utc = None
-
-        result = _submission_to_search_result(submission)
-
-        assert result.snippet == "This is the title"
+    _parse_created_utc(1704067200.0)
+    _parse_created_utc(1704067200.0)
+
+    assert _parse_created_utc_cached.cache_info().hits == 1
 
 
 class TestSearchReddit:
     """Tests for search_reddit function."""
 
     @pytest.mark.asyncio
-    async def test_missing_credentials(self) -> None:
+    async def test_missing_credentials(
+        self, monkeypatch: pytest.MonkeyPatch, reddit_settings: Settings
+    ) -> None:
         """Test error when credentials are missing."""
-        with patch("wintern.sources.reddit.settings") as mock_settings:
-            mock_settings.reddit_client_id = ""
-            mock_settings.reddit_client_secret = ""
+        monkeypatch.setattr(reddit_settings, "reddit_client_id", "")
+        monkeypatch.setattr(reddit_settings, "reddit_client_secret", "")
 
-            with pytest.raises(
-                RedditCredentialsMissingError,
-                match="REDDIT_CLIENT_ID and REDDIT_CLIENT_SECRET",
-            ):
-                await search_reddit("test query")
+        with pytest.raises(
+            RedditCredentialsMissingError,
+            match="REDDIT_CLIENT_ID and REDDIT_CLIENT_SECRET",
+        ):
+            await search_reddit("test query")
 
     @pytest.mark.asyncio
-    async def test_successful_search(self) -> None:
+    async def test_successful_search(
+        self, submission: MagicMock, patched_client: InstallClient
+    ) -> None:
         """Test successful search returns results."""
-        mock_submission = MagicMock()
-        mock_submission.title = "Test Post"
-        mock_submission.selftext = "Test content"
-        mock_submission.permalink = "/r/test/comments/abc/"
-        mock_submission.subreddit = MagicMock(__str__=lambda s: "test")
-        mock_submission.author = MagicMock(__str__=lambda s: "user")
-        mock_submission.score = 100
-        mock_submission.num_comments = 10
-        mock_submission.is_self = True
-        mock_submission.domain = "self.test"
-        mock_submission.created_utc = 1704067200.0
-        mock_submission.removed_by_category = None
-
-        mock_subreddit = AsyncMock()
-
-        async def mock_search_generator(*args, **kwargs):
-            yield mock_submission
-
-        mock_subreddit.search = mock_search_generator
-
-        mock_reddit = AsyncMock()
-        mock_reddit.subreddit = AsyncMock(return_value=mock_subreddit)
-        mock_reddit.close = AsyncMock()
-
-        with (
-            patch("wintern.sources.reddit.settings") as mock_settings,
-            patch("wintern.sources.reddit._create_reddit_client", return_value=mock_reddit),
-        ):
-            mock_settings.reddit_client_id = "test_id"
-            mock_settings.reddit_client_secret = "test_secret"
+        patched_client(FakeReddit(SimpleNamespace(search=make_search_gen([submission]))))
 
-            results = await search_reddit("test query")
+        results = await search_reddit("test query")
 
-            assert len(results) == 1
-            assert results[0].title == "Test Post"
-            assert results[0].source == "reddit"
-            mock_reddit.close.assert_called_once()
+        assert len(results) == 1
+        assert results[0].title == "Test Title"
+        assert results[0].source == "reddit"
 
     @pytest.mark.asyncio
-    async def test_search_with_subreddits(self) -> None:
-        """Test search within specific subreddits."""
-        mock_subreddit = AsyncMock()
+    async def test_injected_client_is_reused(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test an injected client is searched with but left open for its owner."""
 
-        async def mock_search_generator(*args, **kwargs):
-            return
-            yield  # Make it an async generator
+        def _unexpected_client() -> FakeReddit:
+            raise AssertionError("search_reddit should not create a client")
 
-        mock_subreddit.search = mock_search_generator
-
-        mock_reddit = AsyncMock()
-        mock_reddit.subreddit = AsyncMock(return_value=mock_subreddit)
-        mock_reddit.close = AsyncMock()
-
-        with (
-            patch("wintern.sources.reddit.settings") as mock_settings,
-            patch("wintern.sources.reddit._create_reddit_client", return_value=mock_reddit),
-        ):
-            mock_settings.reddit_client_id = "test_id"
-            mock_settings.reddit_client_secret = "test_secret"
+        monkeypatch.setattr(reddit, "_create_reddit_client", _unexpected_client)
+        mock_reddit = FakeReddit(SimpleNamespace(search=make_search_gen()))
 
-            await search_reddit("test", subreddits=["python", "programming"])
+        await search_reddit("test", reddit=mock_reddit)  # type: ignore[arg-type]
 
-            # Verify subreddit was called with joined string
-            mock_reddit.subreddit.assert_called_with("python+programming")
+        assert mock_reddit.last_name == "all"
+        assert not mock_reddit.closed
 
     @pytest.mark.asyncio
-    async def test_search_all_reddit(self) -> None:
-        """Test search across all of Reddit."""
-        mock_subreddit = AsyncMock()
+    async def test_default_client_reused_across_searches(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test consecutive searches share one client and leave it open."""
+        created: list[FakeReddit] = []
 
-        async def mock_search_generator(*args, **kwargs):
-            return
-            yield
+        def _create() -> FakeReddit:
+            created.append(FakeReddit(SimpleNamespace(search=make_search_gen())))
+            return created[-1]
 
-        mock_subreddit.search = mock_search_generator
+        monkeypatch.setattr(reddit, "_create_reddit_client", _create)
 
-        mock_reddit = AsyncMock()
-        mock_reddit.subreddit = AsyncMock(return_value=mock_subreddit)
-        mock_reddit.close = AsyncMock()
+        await search_reddit("first")
+        await search_reddit("second")
 
-        with (
-            patch("wintern.sources.reddit.settings") as mock_settings,
-            patch("wintern.sources.reddit._create_reddit_client", return_value=mock_reddit),
-        ):
-            mock_settings.reddit_client_id = "test_id"
-            mock_settings.reddit_client_secret = "test_secret"
+        assert len(created) == 1
+        assert not created[0].closed
 
-            await search_reddit("test")
+    @pytest.mark.asyncio
+    async def test_shutdown_closes_default_client(self, patched_client: InstallClient) -> None:
+        """Test shutdown_reddit closes and forgets the shared client."""
+        mock_reddit = patched_client(FakeReddit(SimpleNamespace(search=make_search_gen())))
+        await search_reddit("test")
 
-            mock_reddit.subreddit.assert_called_with("all")
+        await shutdown_reddit()
 
-    @pytest.mark.asyncio
-    async def test_skips_removed_posts(self) -> None:
-        """Test that removed posts are skipped."""
-        mock_removed = MagicMock()
-        mock_removed.removed_by_category = "moderator"
+        assert mock_reddit.closed
+        assert reddit._default_client is None
 
-        mock_valid = MagicMock()
-        mock_valid.title = "Valid Post"
-        mock_valid.selftext = "Content"
-        mock_valid.permalink = "/r/test/comments/def/"
-        mock_valid.subreddit = MagicMock(__str__=lambda s: "test")
-        mock_valid.author = MagicMock(__str__=lambda s: "user")
-        mock_valid.score = 50
-        mock_valid.num_comments = 5
-        mock_valid.is_self = True
-        mock_valid.domain = "self.test"
-        mock_valid.created_utc = None
-        mock_valid.removed_by_category = None
-
-        mock_subreddit = AsyncMock()
-
-        async def mock_search_generator(*args, **kwargs):
-            yield mock_removed
-            yield mock_valid
-
-        mock_subreddit.search = mock_search_generator
-
-        mock_reddit = AsyncMock()
-        mock_reddit.subreddit = AsyncMock(return_value=mock_subreddit)
-        mock_reddit.close = AsyncMock()
-
-        with (
-            patch("wintern.sources.reddit.settings") as mock_settings,
-            patch("wintern.sources.reddit._create_reddit_client", return_value=mock_reddit),
-        ):
-            mock_settings.reddit_client_id = "test_id"
-            mock_settings.reddit_client_secret = "test_secret"
+    @pytest.mark.asyncio
+    async def test_search_with_subreddits(self, patched_client: InstallClient) -> None:
+        """Test search within specific subreddits."""
+        mock_reddit = patched_client(FakeReddit(SimpleNamespace(search=make_search_gen())))
 
-            results = await search_reddit("test")
+        await search_reddit("test", subreddits=["python", "programming"])
 
-            assert len(results) == 1
-            assert results[0].title == "Valid Post"
+        # Verify subreddit was called with joined string
+        assert mock_reddit.last_name == "python+programming"
 
     @pytest.mark.asyncio
-    async def test_forbidden_error(self) -> None:
-        """Test handling of forbidden errors."""
-        mock_reddit = AsyncMock()
-        mock_reddit.subreddit = AsyncMock(side_effect=Forbidden(MagicMock()))
-        mock_reddit.close = AsyncMock()
-
-        with (
-            patch("wintern.sources.reddit.settings") as mock_settings,
-            patch("wintern.sources.reddit._create_reddit_client", return_value=mock_reddit),
-        ):
-            mock_settings.reddit_client_id = "test_id"
-            mock_settings.reddit_client_secret = "test_secret"
+    async def test_parallel_subreddits_fans_out(
+        self, submission: MagicMock, patched_client: InstallClient
+    ) -> None:
+        """Test each subreddit is searched separately and results are deduped by URL."""
+        mock_reddit = patched_client(
+            FakeReddit(SimpleNamespace(search=make_search_gen([submission])))
+        )
 
-            with pytest.raises(RedditAuthError, match="Access forbidden"):
-                await search_reddit("test")
+        results = await search_reddit(
+            "test", subreddits=["python", "programming"], parallel_subreddits=True
+        )
+
+        assert mock_reddit.names == ["python", "programming"]
+        assert [result.title for result in results] == ["Test Title"]
 
     @pytest.mark.asyncio
-    async def test_not_found_error(self) -> None:
-        """Test handling of not found errors."""
-        mock_reddit = AsyncMock()
-        mock_reddit.subreddit = AsyncMock(side_effect=NotFound(MagicMock()))
-        mock_reddit.close = AsyncMock()
-
-        with (
-            patch("wintern.sources.reddit.settings") as mock_settings,
-            patch("wintern.sources.reddit._create_reddit_client", return_value=mock_reddit),
-        ):
-            mock_settings.reddit_client_id = "test_id"
-            mock_settings.reddit_client_secret = "test_secret"
+    async def test_parallel_subreddits_interleaves_results(
+        self, base_submission: MagicMock, patched_client: InstallClient
+    ) -> None:
+        """Test a subreddit filling the quota alone does not crowd out the others."""
+
+        def posts(name: str) -> list[MagicMock]:
+            batch = []
+            for i in range(2):
+                post = copy.copy(base_submission)
+                post.title = f"{name} {i}"
+                post.permalink = f"/r/{name}/comments/{i}/"
+                batch.append(post)
+            return batch
+
+        patched_client(
+            FakeReddit(
+                by_name={
+                    name: SimpleNamespace(search=make_search_gen(posts(name)))
+                    for name in ("python", "programming")
+                }
+            )
+        )
 
-            with pytest.raises(RedditAPIError, match="Resource not found"):
-                await search_reddit("test")
+        results = await search_reddit(
+            "test", subreddits=["python", "programming"], count=2, parallel_subreddits=True
+        )
+
+        assert [result.title for result in results] == ["python 0", "programming 0"]
 
     @pytest.mark.asyncio
-    async def test_response_error(self) -> None:
-        """Test handling of response errors."""
-        mock_reddit = AsyncMock()
-        mock_reddit.subreddit = AsyncMock(side_effect=ResponseException(MagicMock()))
-        mock_reddit.close = AsyncMock()
-
-        with (
-            patch("wintern.sources.reddit.settings") as mock_settings,
-            patch("wintern.sources.reddit._create_reddit_client", return_value=mock_reddit),
-        ):
-            mock_settings.reddit_client_id = "test_id"
-            mock_settings.reddit_client_secret = "test_secret"
+    async def test_parallel_subreddits_skips_failed_subreddit(
+        self, submission: MagicMock, patched_client: InstallClient
+    ) -> None:
+        """Test a Reddit error in one subreddit still returns the others' results."""
+        mock_reddit = patched_client(
+            FakeReddit(
+                SimpleNamespace(search=make_search_gen([submission])),
+                subreddit_side_effect=NotFound(_EXC_ARG),
+                failing_names=["private"],
+            )
+        )
 
-            with pytest.raises(RedditAPIError, match="Response error"):
-                await search_reddit("test")
+        results = await search_reddit(
+            "test", subreddits=["private", "python"], parallel_subreddits=True
+        )
 
-    @pytest.mark.asyncio
-    async def test_count_clamping(self) -> None:
-        """Test that count is clamped to valid range."""
-        mock_subreddit = AsyncMock()
+        assert sorted(mock_reddit.names) == ["private", "python"]
+        assert [result.title for result in results] == ["Test Title"]
 
-        async def mock_search_generator(*args, **kwargs):
-            # Verify limit was clamped
-            assert kwargs.get("limit") == 100
-            return
-            yield
+    @pytest.mark.asyncio
+    async def test_parallel_subreddits_all_failed(self, patched_client: InstallClient) -> None:
+        """Test the search still fails when every subreddit errors."""
+        patched_client(FakeReddit(subreddit_side_effect=NotFound(_EXC_ARG)))
 
-        mock_subreddit.search = mock_search_generator
+        with pytest.raises(RedditAPIError, match="Resource not found"):
+            await search_reddit("test", subreddits=["a", "b"], parallel_subreddits=True)
 
-        mock_reddit = AsyncMock()
-        mock_reddit.subreddit = AsyncMock(return_value=mock_subreddit)
-        mock_reddit.close = AsyncMock()
+    @pytest.mark.asyncio
+    async def test_subreddit_name_cached(self, patched_client: InstallClient) -> None:
+        """Test repeated searches over the same subreddits reuse the built name."""
+        patched_client(FakeReddit(SimpleNamespace(search=make_search_gen())))
+        _subreddit_name.cache_clear()
 
-        with (
-            patch("wintern.sources.reddit.settings") as mock_settings,
-            patch("wintern.sources.reddit._create_reddit_client", return_value=mock_reddit),
-        ):
-            mock_settings.reddit_client_id = "test_id"
-            mock_settings.reddit_client_secret = "test_secret"
+        await search_reddit("first", subreddits=["python", "programming"])
+        await search_reddit("second", subreddits=["python", "programming"])
 
-            await search_reddit("test", count=200)
+        assert _subreddit_name.cache_info().hits == 1
 
+    @pytest.mark.asyncio
+    async def test_search_all_reddit(self, patched_client: InstallClient) -> None:
+        """Test search across all of Reddit."""
+        mock_reddit = patched_client(FakeReddit(SimpleNamespace(search=make_search_gen())))
 
-class TestRedditSource:
-    """Tests for RedditSource class."""
+        await search_reddit("test")
 
-    def test_source_name(self) -> None:
-        """Test source name property."""
-        source = RedditSource()
-        assert source.source_name == "reddit"
+        assert mock_reddit.last_name == "all"
 
     @pytest.mark.asyncio
-    async def test_search_delegates_to_search_reddit(self) -> None:
-        """Test that search method delegates to search_reddit."""
-        with patch("wintern.sources.reddit.search_reddit") as mock_search:
-            mock_search.return_value = []
+    @pytest.mark.parametrize(
+        ("attr", "value"),
+        [
+            ("removed_by_category", "moderator"),
+            ("banned_by", "automoderator"),
+            ("removal_reason", "spam"),
+        ],
+    )
+    async def test_skips_removed_posts(
+        self,
+        base_submission: MagicMock,
+        patched_client: InstallClient,
+        attr: str,
+        value: str,
+    ) -> None:
+        """Test that removed posts are skipped."""
+        mock_removed = copy.copy(base_submission)
+        setattr(mock_removed, attr, value)
 
-            source = RedditSource()
-            await source.search("test query", count=10)
+        mock_valid = copy.copy(base_submission)
+        mock_valid.title = "Valid Post"
 
-            mock_search.assert_called_once()
-            call_kwargs = mock_search.call_args[1]
-            assert call_kwargs["count"] == 10
+        search = make_search_gen([mock_removed, mock_valid])
+        patched_client(FakeReddit(SimpleNamespace(search=search)))
 
-    @pytest.mark.asyncio
-    async def test_search_with_time_filter(self) -> None:
-        """Test search with time filter parameter."""
-        with patch("wintern.sources.reddit.search_reddit") as mock_search:
-            mock_search.return_value = []
+        results = await search_reddit("test")
 
-            source = RedditSource()
-            await source.search("test", time_filter="month")
+        assert len(results) == 1
+        assert results[0].title == "Valid Post"
 
-            call_kwargs = mock_search.call_args[1]
-            assert call_kwargs["time_filter"] == "month"
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("raised", "expected", "match"),
+        [
+            pytest.param(Forbidden, RedditAuthError, "Access forbidden", id="forbidden"),
+            pytest.param(NotFound, RedditAPIError, "Resource not found", id="not_found"),
+            pytest.param(ResponseException, RedditAPIError, "Response error", id="response"),
+        ],
+    )
+    async def test_error_paths(
+        self,
+        patched_client: InstallClient,
+        raised: type[ResponseException],
+        expected: type[RedditError],
+        match: str,
+    ) -> None:
+        """Test Reddit API exceptions are wrapped in the matching RedditError."""
+        patched_client(FakeReddit(subreddit_side_effect=raised(_EXC_ARG)))
+
+        with pytest.raises(expected, match=match):
+            await search_reddit("test")
 
     @pytest.mark.asyncio
-    async def test_search_with_invalid_time_filter(self) -> None:
-        """Test search with invalid time filter defaults to week."""
-        with patch("wintern.sources.reddit.search_reddit") as mock_search:
-            mock_search.return_value = []
+    @pytest.mark.parametrize(
+        ("count", "limit"),
+        [pytest.param(200, 100, id="upper"), pytest.param(0, 1, id="lower")],
+    )
+    async def test_count_clamping(
+        self, patched_client: InstallClient, count: int, limit: int
+    ) -> None:
+        """Test that count is clamped to valid range."""
+        search = make_search_gen(assert_limit=limit)
+        patched_client(FakeReddit(SimpleNamespace(search=search)))
 
-            source = RedditSource()
-            await source.search("test", time_filter="invalid")
+        await search_reddit("test", count=count)
 
-            call_kwargs = mock_search.call_args[1]
-            assert call_kwargs["time_filter"] == "week"
 
-    @pytest.mark.asyncio
-    async def test_search_with_subreddits(self) -> None:
-        """Test search with subreddits parameter."""
-        with patch("wintern.sources.reddit.search_reddit") as mock_search:
-            mock_search.return_value = []
+class TestRedditSource:
+    """Tests for RedditSource class."""
 
-            source = RedditSource()
-            await source.search("test", subreddits=["python", "programming"])
+    def test_source_name(self, source: RedditSource) -> None:
+        """Test source name property."""
+        assert source.source_name == "reddit"
 
-            call_kwargs = mock_search.call_args[1]
-            assert call_kwargs["subreddits"] == ["python", "programming"]
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("call_kwargs", "expected"),
+        [
+            pytest.param({"count": 10}, {"count": 10}, id="count"),
+            pytest.param({"time_filter": "month"}, {"time_filter": "month"}, id="time_filter"),
+            pytest.param(
+                {"time_filter": "invalid"}, {"time_filter": "week"}, id="invalid_time_filter"
+            ),
+            pytest.param(
+                {"subreddits": ["python", "programming"]},
+                {"subreddits": ["python", "programming"]},
+                id="subreddits",
+            ),
+        ],
+    )
+    async def test_search_delegates_to_search_reddit(
+        self,
+        source: RedditSource,
+        monkeypatch: pytest.MonkeyPatch,
+        call_kwargs: dict[str, Any],
+        expected: dict[str, Any],
+    ) -> None:
+        """Test that search forwards normalized arguments to search_reddit."""
+        calls: list[dict[str, Any]] = []
+
+        async def fake_search_reddit(query: str, **kwargs: Any) -> list:
+            calls.append(kwargs)
+            return []
+
+        monkeypatch.setattr(reddit, "search_reddit", fake_search_reddit)
+
+        await source.search("test", **call_kwargs)
+
+        assert len(calls) == 1
+        assert {key: calls[0][key] for key in expected} == expected
 
     @pytest.mark.asyncio
-    async def test_health_check_missing_credentials(self) -> None:
+    async def test_health_check_missing_credentials(
+        self, source: RedditSource, monkeypatch: pytest.MonkeyPatch, reddit_settings: Settings
+    ) -> None:
         """Test health check when credentials are missing."""
-        with patch("wintern.sources.reddit.settings") as mock_settings:
-            mock_settings.reddit_client_id = ""
-            mock_settings.reddit_client_secret = ""
+        monkeypatch.setattr(reddit_settings, "reddit_client_id", "")
+        monkeypatch.setattr(reddit_settings, "reddit_client_secret", "")
 
-            source = RedditSource()
-            result = await source.health_check()
+        result = await source.health_check()
 
-            assert result is False
+        assert result is False
 
     @pytest.mark.asyncio
-    async def test_health_check_success(self) -> None:
+    async def test_health_check_success(
+        self, source: RedditSource, patched_client: InstallClient
+    ) -> None:
         """Test health check when credentials are valid."""
-        mock_user = MagicMock()
-        mock_user.me = AsyncMock(return_value=None)  # App-only auth returns None
+        # App-only auth returns None from user.me()
+        mock_reddit = patched_client(FakeReddit(user=SimpleNamespace(me=_async_none)))
 
-        mock_reddit = AsyncMock()
-        mock_reddit.user = mock_user
-        mock_reddit.close = AsyncMock()
+        result = await source.health_check()
 
-        with (
-            patch("wintern.sources.reddit.settings") as mock_settings,
-            patch("wintern.sources.reddit._create_reddit_client", return_value=mock_reddit),
-        ):
-            mock_settings.reddit_client_id = "test_id"
-            mock_settings.reddit_client_secret = "test_secret"
-
-            source = RedditSource()
-            result = await source.health_check()
-
-            assert result is True
-            mock_reddit.close.assert_called_once()
+        assert result is True
+        assert mock_reddit.closed
 
     @pytest.mark.asyncio
-    async def test_health_check_auth_failure(self) -> None:
+    async def test_health_check_auth_failure(
+        self, source: RedditSource, patched_client: InstallClient
+    ) -> None:
         """Test health check when authentication fails."""
-        mock_user = MagicMock()
-        mock_user.me = AsyncMock(side_effect=Forbidden(MagicMock()))
-
-        mock_reddit = AsyncMock()
-        mock_reddit.user = mock_user
-        mock_reddit.close = AsyncMock()
+        patched_client(FakeReddit(user=SimpleNamespace(me=_raise_forbidden)))
 
-        with (
-            patch("wintern.sources.reddit.settings") as mock_settings,
-            patch("wintern.sources.reddit._create_reddit_client", return_value=mock_reddit),
-        ):
-            mock_settings.reddit_client_id = "bad_id"
-            mock_settings.reddit_client_secret = "bad_secret"
-
-            source = RedditSource()
-            result = await source.health_check()
+        result = await source.health_check()
 
-            assert result is False
+        assert result is False
 
 
-class TestExceptionHierarchy:
-    """Tests for exception class hierarchy."""
+@pytest.mark.parametrize(
+    "error_cls", [RedditCredentialsMissingError, RedditAuthError, RedditAPIError]
+)
+def test_reddit_error_is_base(error_cls: type[RedditError]) -> None:
+    """Test RedditError is the base exception."""
+    assert issubclass(error_cls, RedditError)
 
-    def test_reddit_error_is_base(self) -> None:
-        """Test RedditError is the base exception."""
-        assert issubclass(RedditCredentialsMissingError, RedditError)
-        assert issubclass(RedditAuthError, RedditError)
-        assert issubclass(RedditAPIError, RedditError)
 
-    def test_reddit_api_error_message(self) -> None:
-        """Test RedditAPIError includes message."""
-        error = RedditAPIError("Something went wrong")
-        assert "Reddit API error" in str(error)
-        assert "Something went wrong" in str(error)
+def test_reddit_api_error_message() -> None:
+    """Test RedditAPIError includes message."""
+    error = RedditAPIError("Something went wrong")
+    assert "Reddit API error" in str(error)
+    assert "Something went wrong" in str(error)
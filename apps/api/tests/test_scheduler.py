@@ -1,16 +1,23 @@
 """Tests for the execution scheduler - APScheduler integration."""
 
+import asyncio
+import socket
 import uuid
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from wintern.execution import scheduler as sched_module
 from wintern.execution.scheduler import (
     CHECK_INTERVAL_SECONDS,
+    CHECK_JOB_ID,
+    MIN_CHECK_DELAY_SECONDS,
     check_and_run_due_winterns,
     get_scheduler,
+    schedule_check_at,
     setup_scheduler,
     shutdown_scheduler,
     start_scheduler,
@@ -35,6 +42,14 @@ class TestSetupScheduler:
 
         assert not scheduler.running
 
+    def test_job_defaults(self):
+        """Should coalesce missed runs and never overlap the check job."""
+        scheduler = setup_scheduler()
+
+        assert scheduler._job_defaults["coalesce"] is True
+        assert scheduler._job_defaults["max_instances"] == 1
+        assert scheduler._job_defaults["misfire_grace_time"] == 60
+
 
 class TestStartScheduler:
     """Tests for starting the scheduler."""
@@ -46,11 +61,16 @@ class TestStartScheduler:
         try:
             scheduler = start_scheduler()
 
+            assert scheduler is not None
             assert scheduler.running
             # Check job was added
             jobs = scheduler.get_jobs()
             assert len(jobs) == 1
             assert jobs[0].id == "check_due_winterns"
+            # First check runs soon after startup, not a full interval later
+            assert jobs[0].next_run_time <= datetime.now(UTC) + timedelta(
+                seconds=MIN_CHECK_DELAY_SECONDS
+            )
 
         finally:
             if scheduler:
@@ -78,6 +98,44 @@ class TestStartScheduler:
             sched_module._scheduler = None
 
 
+@pytest.fixture
+def lock_port(monkeypatch: pytest.MonkeyPatch) -> int:
+    """Configure the scheduler lock on a free localhost port."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    monkeypatch.setattr(sched_module.settings, "scheduler_lock_port", port)
+    return port
+
+
+class TestLeaderLock:
+    """Tests for the cross-process scheduler lock."""
+
+    @pytest.mark.asyncio
+    async def test_skips_scheduler_when_lock_held(self, lock_port: int):
+        """Should not start a scheduler while another process holds the lock."""
+        sched_module._scheduler = None
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as other_process:
+            other_process.bind(("127.0.0.1", lock_port))
+            other_process.listen(1)
+
+            assert start_scheduler() is None
+            assert get_scheduler() is None
+
+    @pytest.mark.asyncio
+    async def test_shutdown_releases_lock(self, lock_port: int):
+        """Should free the lock port when the scheduler shuts down."""
+        scheduler = start_scheduler()
+        assert scheduler is not None
+        assert scheduler.running
+
+        await shutdown_scheduler()
+
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            # Should not raise now that the lock is released
+            sock.bind(("127.0.0.1", lock_port))
+
+
 class TestShutdownScheduler:
     """Tests for shutting down the scheduler."""
 
@@ -85,6 +143,7 @@ class TestShutdownScheduler:
     async def test_shuts_down_running_scheduler(self):
         """Should gracefully shutdown a running scheduler."""
         scheduler = start_scheduler()
+        assert scheduler is not None
         assert scheduler.running
 
         await shutdown_scheduler()
@@ -135,6 +194,75 @@ class TestGetScheduler:
             sched_module._scheduler = None
 
 
+@pytest.fixture
+async def running_scheduler():
+    """Start the global scheduler and shut it down after the test."""
+    scheduler = start_scheduler()
+    assert scheduler is not None
+    yield scheduler
+    scheduler.shutdown(wait=False)
+    sched_module._scheduler = None
+    sched_module.execution_service.set_next_run_listener(None)
+
+
+class TestScheduleCheckAt:
+    """Tests for waking the check job when a wintern is scheduled."""
+
+    @pytest.mark.asyncio
+    async def test_moves_check_earlier(self, running_scheduler):
+        """Should pull the check job forward to a sooner run time."""
+        run_at = datetime.now(UTC) + timedelta(seconds=10)
+
+        schedule_check_at(run_at)
+
+        assert running_scheduler.get_job(CHECK_JOB_ID).next_run_time == run_at
+
+    @pytest.mark.asyncio
+    async def test_keeps_earlier_check(self, running_scheduler):
+        """Should not push an already earlier check later."""
+        run_at = datetime.now(UTC) + timedelta(seconds=10)
+        schedule_check_at(run_at)
+
+        schedule_check_at(run_at + timedelta(minutes=1))
+
+        assert running_scheduler.get_job(CHECK_JOB_ID).next_run_time == run_at
+
+    @pytest.mark.asyncio
+    async def test_ignores_unscheduled_wintern(self, running_scheduler):
+        """Should leave the check job alone when there is no run time."""
+        before = running_scheduler.get_job(CHECK_JOB_ID).next_run_time
+
+        schedule_check_at(None)
+
+        assert running_scheduler.get_job(CHECK_JOB_ID).next_run_time == before
+
+    @pytest.mark.asyncio
+    async def test_registered_for_next_run_notifications(self, running_scheduler):
+        """Starting the scheduler should route notify_next_run_at to the check job."""
+        run_at = datetime.now(UTC) + timedelta(seconds=10)
+
+        sched_module.execution_service.notify_next_run_at(run_at)
+
+        assert running_scheduler.get_job(CHECK_JOB_ID).next_run_time == run_at
+
+    def test_handles_no_scheduler(self):
+        """Should do nothing when the scheduler is not running."""
+        sched_module._scheduler = None
+
+        # Should not raise
+        schedule_check_at(datetime.now(UTC))
+
+
+@dataclass(slots=True, frozen=True)
+class FakeWintern:
+    """The Wintern fields the scheduler reads, for tests that mock the database."""
+
+    id: uuid.UUID
+    name: str = "Test Wintern"
+    cron_schedule: str = "* * * * *"
+    next_run_at: datetime | None = None
+
+
 @pytest.fixture
 async def test_user(test_session: AsyncSession):
     """Create a test user."""
@@ -162,8 +290,6 @@ async def due_wintern(test_session: AsyncSession, test_user):
         next_run_at=datetime.now(UTC) - timedelta(minutes=5),
         is_active=True,
     )
-    test_session.add(wintern)
-    await test_session.flush()
 
     # Add required configs
     source = SourceConfig(
@@ -172,7 +298,6 @@ async def due_wintern(test_session: AsyncSession, test_user):
         config={},
         is_active=True,
     )
-    test_session.add(source)
 
     delivery = DeliveryConfig(
         wintern_id=wintern.id,
@@ -180,7 +305,7 @@ async def due_wintern(test_session: AsyncSession, test_user):
         config={"webhook_url": "https://hooks.slack.com/test"},
         is_active=True,
     )
-    test_session.add(delivery)
+    test_session.add_all([wintern, source, delivery])
     await test_session.flush()
 
     return wintern
@@ -189,6 +314,13 @@ async def due_wintern(test_session: AsyncSession, test_user):
 class TestCheckAndRunDueWinterns:
     """Tests for the scheduled job that checks for due winterns."""
 
+    @pytest.fixture(autouse=True)
+    def mock_claim(self, monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+        """Let this instance claim every due wintern."""
+        claim = AsyncMock(return_value=True)
+        monkeypatch.setattr(sched_module.execution_service, "claim_wintern_run", claim)
+        return claim
+
     @pytest.mark.asyncio
     async def test_no_due_winterns(self):
         """Should handle case where no winterns are due."""
@@ -202,9 +334,7 @@ class TestCheckAndRunDueWinterns:
     @pytest.mark.asyncio
     async def test_executes_due_winterns(self):
         """Should execute winterns that are due."""
-        mock_wintern = MagicMock()
-        mock_wintern.id = uuid.uuid4()
-        mock_wintern.name = "Test Wintern"
+        mock_wintern = FakeWintern(id=uuid.uuid4(), name="Test Wintern")
 
         with (
             patch(
@@ -220,17 +350,14 @@ class TestCheckAndRunDueWinterns:
             await check_and_run_due_winterns()
 
             mock_execute.assert_called_once()
+            # The claim already advanced next_run_at
+            assert mock_execute.call_args.kwargs == {"advance_schedule": False}
 
     @pytest.mark.asyncio
     async def test_continues_on_execution_error(self):
         """Should continue executing other winterns if one fails."""
-        mock_wintern1 = MagicMock()
-        mock_wintern1.id = uuid.uuid4()
-        mock_wintern1.name = "Wintern 1"
-
-        mock_wintern2 = MagicMock()
-        mock_wintern2.id = uuid.uuid4()
-        mock_wintern2.name = "Wintern 2"
+        mock_wintern1 = FakeWintern(id=uuid.uuid4(), name="Wintern 1")
+        mock_wintern2 = FakeWintern(id=uuid.uuid4(), name="Wintern 2")
 
         from wintern.execution.executor import ExecutionError
 
@@ -251,11 +378,202 @@ class TestCheckAndRunDueWinterns:
             # Both should have been attempted
             assert mock_execute.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_uses_one_instant_per_tick(self, mock_claim: AsyncMock):
+        """Should query and claim due winterns against the same tick time."""
+        mock_winterns = [FakeWintern(id=uuid.uuid4()) for _ in range(3)]
+
+        with (
+            patch(
+                "wintern.execution.scheduler.execution_service.get_due_winterns",
+                return_value=mock_winterns,
+            ) as mock_get_due,
+            patch(
+                "wintern.execution.scheduler.execute_wintern",
+                new_callable=AsyncMock,
+            ),
+        ):
+            await check_and_run_due_winterns()
+
+        as_of = mock_get_due.call_args.kwargs["as_of"]
+        assert mock_claim.await_count == 3
+        assert all(call.kwargs["as_of"] is as_of for call in mock_claim.await_args_list)
+
+    @pytest.mark.asyncio
+    async def test_skips_wintern_claimed_elsewhere(self, mock_claim: AsyncMock):
+        """Should not execute a wintern another instance already claimed."""
+        mock_wintern = FakeWintern(id=uuid.uuid4(), name="Test Wintern")
+        mock_claim.return_value = False
+
+        with (
+            patch(
+                "wintern.execution.scheduler.execution_service.get_due_winterns",
+                return_value=[mock_wintern],
+            ),
+            patch(
+                "wintern.execution.scheduler.execute_wintern",
+                new_callable=AsyncMock,
+            ) as mock_execute,
+        ):
+            await check_and_run_due_winterns()
+
+            mock_claim.assert_awaited_once()
+            mock_execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_releases_loading_session_before_executing(
+        self, test_engine, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Should not hold the loading session's connection while executing."""
+        from wintern.auth.models import User
+
+        session_factory = async_sessionmaker(test_engine, expire_on_commit=False)
+        sessions: list[AsyncSession] = []
+
+        def tracking_session() -> AsyncSession:
+            session = session_factory()
+            sessions.append(session)
+            return session
+
+        monkeypatch.setattr(sched_module, "async_session", tracking_session)
+
+        async with session_factory() as session:
+            user = User(
+                id=uuid.uuid4(),
+                email="scheduler-leak@example.com",
+                hashed_password="hashedpassword",
+            )
+            wintern = Wintern(
+                id=uuid.uuid4(),
+                user_id=user.id,
+                name="Due Wintern",
+                context="Test context",
+                cron_schedule="* * * * *",
+                next_run_at=datetime.now(UTC) - timedelta(minutes=5),
+                is_active=True,
+            )
+            session.add_all([user, wintern])
+            await session.commit()
+
+        async def assert_loading_session_released(session, wintern_id, **kwargs):
+            assert not sessions[0].in_transaction()
+            return uuid.uuid4()
+
+        with patch(
+            "wintern.execution.scheduler.execute_wintern",
+            new_callable=AsyncMock,
+            side_effect=assert_loading_session_released,
+        ) as mock_execute:
+            await check_and_run_due_winterns()
+
+            mock_execute.assert_called_once()
+        assert not any(session.in_transaction() for session in sessions)
+
+    @pytest.mark.asyncio
+    async def test_executes_due_winterns_concurrently(self):
+        """Should run due winterns concurrently rather than one after another."""
+        mock_winterns = [FakeWintern(id=uuid.uuid4()) for _ in range(2)]
+        in_flight = 0
+        peak_in_flight = 0
+        all_started = asyncio.Event()
+
+        async def slow_execute(session, wintern_id, **kwargs):
+            nonlocal in_flight, peak_in_flight
+            in_flight += 1
+            peak_in_flight = max(peak_in_flight, in_flight)
+            if in_flight == len(mock_winterns):
+                all_started.set()
+            try:
+                # Run one after another, the first call would time out here alone
+                await asyncio.wait_for(all_started.wait(), timeout=5)
+            finally:
+                in_flight -= 1
+            return uuid.uuid4()
+
+        with (
+            patch(
+                "wintern.execution.scheduler.execution_service.get_due_winterns",
+                return_value=mock_winterns,
+            ),
+            patch(
+                "wintern.execution.scheduler.execute_wintern",
+                new_callable=AsyncMock,
+                side_effect=slow_execute,
+            ) as mock_execute,
+        ):
+            await check_and_run_due_winterns()
+
+            assert mock_execute.call_count == 2
+            assert peak_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_schedules_next_check_for_next_due(
+        self, running_scheduler, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Should move the next check to the soonest next_run_at."""
+        next_run_at = datetime.now(UTC) + timedelta(minutes=2)
+        monkeypatch.setattr(
+            sched_module.execution_service, "get_due_winterns", AsyncMock(return_value=[])
+        )
+        monkeypatch.setattr(
+            sched_module.execution_service,
+            "get_earliest_next_run_at",
+            AsyncMock(return_value=next_run_at),
+        )
+
+        await check_and_run_due_winterns()
+
+        assert running_scheduler.get_job(CHECK_JOB_ID).next_run_time == next_run_at
+
+    @pytest.mark.asyncio
+    async def test_next_check_respects_minimum_delay(
+        self, running_scheduler, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Should not re-check immediately for a next_run_at already in the past."""
+        monkeypatch.setattr(
+            sched_module.execution_service, "get_due_winterns", AsyncMock(return_value=[])
+        )
+        monkeypatch.setattr(
+            sched_module.execution_service,
+            "get_earliest_next_run_at",
+            AsyncMock(return_value=datetime.now(UTC) - timedelta(hours=1)),
+        )
+        before = datetime.now(UTC)
+
+        await check_and_run_due_winterns()
+
+        next_check = running_scheduler.get_job(CHECK_JOB_ID).next_run_time
+        assert next_check >= before + timedelta(seconds=MIN_CHECK_DELAY_SECONDS)
+
+    @pytest.mark.asyncio
+    async def test_next_check_bounded_without_listener(
+        self, running_scheduler, monkeypatch: pytest.MonkeyPatch
+    ):
+        """A wintern scheduled in another worker should be checked within the interval."""
+        monkeypatch.setattr(
+            sched_module.execution_service, "get_due_winterns", AsyncMock(return_value=[])
+        )
+        monkeypatch.setattr(
+            sched_module.execution_service,
+            "get_earliest_next_run_at",
+            AsyncMock(return_value=None),
+        )
+        await check_and_run_due_winterns()
+
+        # Another worker runs no scheduler, so its notification reaches no listener
+        sched_module.execution_service.set_next_run_listener(None)
+        run_at = datetime.now(UTC) + timedelta(seconds=10)
+        sched_module.execution_service.notify_next_run_at(run_at)
+
+        next_check = running_scheduler.get_job(CHECK_JOB_ID).next_run_time
+        assert next_check <= run_at + timedelta(seconds=CHECK_INTERVAL_SECONDS)
+
 
 class TestSchedulerConstants:
     """Tests for scheduler configuration constants."""
 
     def test_check_interval_is_reasonable(self):
         """Check interval should be reasonable (1-10 minutes)."""
+        assert MIN_CHECK_DELAY_SECONDS < CHECK_INTERVAL_SECONDS
         assert 60 <= CHECK_INTERVAL_SECONDS <= 600
         assert CHECK_INTERVAL_SECONDS == 300  # 5 minutes as specified
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -16,6 +18,7 @@ from wintern.delivery import (
     SlackWebhookError,
     SlackWebhookMissingError,
     send_slack,
+    slack,
     slack_delivery,
 )
 from wintern.delivery.slack import (
@@ -54,12 +57,27 @@ def sample_payload(sample_item: DeliveryItem) -> DeliveryPayload:
 
 
 @pytest.fixture
-def mock_webhook_response() -> MagicMock:
-    """Create a mock webhook response."""
-    response = MagicMock()
-    response.status_code = 200
-    response.body = "ok"
-    return response
+def mock_webhook_response() -> SimpleNamespace:
+    """Create a stand-in webhook response with the fields send_slack reads."""
+    return SimpleNamespace(status_code=200, body="ok")
+
+
+@pytest.fixture
+def mock_slack_client(
+    mock_webhook_response: SimpleNamespace,
+) -> Iterator[tuple[MagicMock, SimpleNamespace]]:
+    """Patch AsyncWebhookClient with a mock client that returns mock_webhook_response.
+
+    Yields the patched class and its client instance; tests adjust the
+    response or set ``send.side_effect`` to simulate failures.
+    """
+    with patch("wintern.delivery.slack.AsyncWebhookClient") as mock_client_class:
+        mock_client = SimpleNamespace(
+            send=AsyncMock(return_value=mock_webhook_response),
+            retry_handlers=[],
+        )
+        mock_client_class.return_value = mock_client
+        yield mock_client_class, mock_client
 
 
 # -----------------------------------------------------------------------------
@@ -170,107 +188,104 @@ class TestDeliveryResult:
 class TestEscapeMrkdwnText:
     """Tests for _escape_mrkdwn_text function (display text escaping)."""
 
-    def test_escape_pipe(self) -> None:
-        """Test that pipe characters are escaped."""
-        result = _escape_mrkdwn_text("Hello | World")
-        assert "|" not in result
-        assert "\u2223" in result  # Unicode DIVIDES character
-
-    def test_escape_angle_brackets(self) -> None:
-        """Test that angle brackets are escaped."""
-        result = _escape_mrkdwn_text("<tag>content</tag>")
-        assert "<" not in result
-        assert ">" not in result
-        assert "&lt;" in result
-        assert "&gt;" in result
-
-    def test_escape_ampersand(self) -> None:
-        """Test that ampersands are escaped."""
-        result = _escape_mrkdwn_text("A & B")
-        assert "&amp;" in result
-
-    def test_escape_order(self) -> None:
-        """Test that ampersands are escaped before other entities."""
-        # This ensures we don't double-escape &lt; to &amp;lt;
-        result = _escape_mrkdwn_text("A & B < C")
-        assert "&amp;" in result
-        assert "&lt;" in result
-        assert "&amp;lt;" not in result
-
-    def test_no_escape_needed(self) -> None:
-        """Test that clean text passes through unchanged."""
-        result = _escape_mrkdwn_text("Hello World")
-        assert result == "Hello World"
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            # Pipe becomes Unicode DIVIDES (U+2223)
+            ("Hello | World", "Hello \u2223 World"),
+            ("<tag>content</tag>", "&lt;tag&gt;content&lt;/tag&gt;"),
+            ("A & B", "A &amp; B"),
+            # Ampersands are not double-escaped into &amp;lt;
+            ("A & B < C", "A &amp; B &lt; C"),
+            ("Hello World", "Hello World"),
+        ],
+        ids=["pipe", "angle-brackets", "ampersand", "no-double-escape", "clean"],
+    )
+    def test_escape(self, text: str, expected: str) -> None:
+        """Test escaping of each mrkdwn special character."""
+        assert _escape_mrkdwn_text(text) == expected
+
+    def test_clean_text_not_copied(self) -> None:
+        """Test that text without special characters is returned as-is."""
+        text = "".join(["Hello", " World"])
+        # Bypass the cache, which may already hold an equal string
+        assert _escape_mrkdwn_text.__wrapped__(text) is text
+
+    def test_repeat_calls_cached(self) -> None:
+        """Test that escaping the same text again reuses the cached result."""
+        first = _escape_mrkdwn_text("Cached | title")
+        assert _escape_mrkdwn_text("Cached | title") is first
 
 
 class TestEscapeMrkdwnUrl:
     """Tests for _escape_mrkdwn_url function (URL escaping)."""
 
-    def test_escape_pipe_in_url(self) -> None:
-        """Test that pipe characters in URLs are URL-encoded."""
-        result = _escape_mrkdwn_url("https://example.com/path?a=1|2")
-        assert "|" not in result
-        assert "%7C" in result
-
-    def test_escape_greater_than_in_url(self) -> None:
-        """Test that > characters in URLs are URL-encoded."""
-        result = _escape_mrkdwn_url("https://example.com/path?redirect=>next")
-        assert ">" not in result
-        assert "%3E" in result
-
-    def test_escape_both_pipe_and_gt(self) -> None:
-        """Test escaping both pipe and > in the same URL."""
-        result = _escape_mrkdwn_url("https://example.com/?a|b>c")
-        assert "|" not in result
-        assert ">" not in result
-        assert "%7C" in result
-        assert "%3E" in result
-
-    def test_no_escape_needed(self) -> None:
-        """Test that clean URLs pass through unchanged."""
-        url = "https://example.com/article?id=123&category=tech"
-        result = _escape_mrkdwn_url(url)
-        assert result == url
-
-    def test_preserves_other_url_encoded_chars(self) -> None:
-        """Test that existing URL encoding is preserved."""
-        url = "https://example.com/search?q=hello%20world"
-        result = _escape_mrkdwn_url(url)
-        assert result == url
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("https://example.com/path?a=1|2", "https://example.com/path?a=1%7C2"),
+            (
+                "https://example.com/path?redirect=>next",
+                "https://example.com/path?redirect=%3Enext",
+            ),
+            ("https://example.com/?a|b>c", "https://example.com/?a%7Cb%3Ec"),
+            (
+                "https://example.com/article?id=123&category=tech",
+                "https://example.com/article?id=123&category=tech",
+            ),
+            # Existing URL encoding is preserved
+            (
+                "https://example.com/search?q=hello%20world",
+                "https://example.com/search?q=hello%20world",
+            ),
+        ],
+        ids=["pipe", "greater-than", "pipe-and-greater-than", "clean", "already-encoded"],
+    )
+    def test_escape(self, url: str, expected: str) -> None:
+        """Test URL-encoding of characters that break mrkdwn links."""
+        assert _escape_mrkdwn_url(url) == expected
+
+    def test_clean_url_not_copied(self) -> None:
+        """Test that URLs without special characters are returned as-is."""
+        url = "".join(["https://example.com", "/article"])
+        # Bypass the cache, which may already hold an equal string
+        assert _escape_mrkdwn_url.__wrapped__(url) is url
 
 
 class TestFormatItemBlock:
     """Tests for _format_item_block function."""
 
-    def test_format_high_score_item(self, sample_item: DeliveryItem) -> None:
-        """Test formatting a high-score item (green emoji)."""
+    def test_format_item(self, sample_item: DeliveryItem) -> None:
+        """Test formatting an item as a section linking to the article."""
         block = _format_item_block(sample_item, 1)
         assert block["type"] == "section"
-        assert "🟢" in block["text"]["text"]
         assert sample_item.title in block["text"]["text"]
         assert sample_item.url in block["text"]["text"]
 
-    def test_format_medium_score_item(self) -> None:
-        """Test formatting a medium-score item (yellow emoji)."""
-        item = DeliveryItem(
-            url="https://example.com",
-            title="Medium Article",
-            relevance_score=65,
-            reasoning="Somewhat relevant.",
-        )
-        block = _format_item_block(item, 2)
-        assert "🟡" in block["text"]["text"]
-
-    def test_format_low_score_item(self) -> None:
-        """Test formatting a low-score item (red emoji)."""
-        item = DeliveryItem(
+    @pytest.mark.parametrize(
+        ("score", "emoji"),
+        [
+            (100, "🟢"),
+            (80, "🟢"),
+            (79, "🟡"),
+            (60, "🟡"),
+            (59, "🔴"),
+            (0, "🔴"),
+            (999, "🟢"),
+            (-1, "🔴"),
+        ],
+    )
+    def test_format_score_emoji(self, score: int, emoji: str) -> None:
+        """Test the score indicator at each bucket boundary and for out-of-range scores."""
+        # Unvalidated, as items converted with model_construct are
+        item = DeliveryItem.model_construct(
             url="https://example.com",
-            title="Low Article",
-            relevance_score=45,
-            reasoning="Not very relevant.",
+            title="Article",
+            relevance_score=score,
+            reasoning="Test reasoning.",
         )
-        block = _format_item_block(item, 3)
-        assert "🔴" in block["text"]["text"]
+        block = _format_item_block(item, 1)
+        assert emoji in block["text"]["text"]
 
     def test_format_item_with_long_excerpt(self) -> None:
         """Test that long excerpts are truncated."""
@@ -332,14 +347,23 @@ class TestBuildBlocks:
         assert blocks[0]["type"] == "header"
         assert blocks[1]["type"] == "divider"
 
+    def test_build_blocks_does_not_share_blocks(self, sample_payload: DeliveryPayload) -> None:
+        """Mutating one message's blocks should not leak into the next message."""
+        blocks = _build_blocks(sample_payload)
+        blocks[1]["type"] = "mutated"
+
+        assert _build_blocks(sample_payload)[1]["type"] == "divider"
+
     def test_build_blocks_truncates_items(self) -> None:
         """Test that items are truncated at MAX_ITEMS_PER_MESSAGE."""
+        # Validation is covered by TestDeliveryItem; skip it for bulk items here
         items = [
-            DeliveryItem(
+            DeliveryItem.model_construct(
                 url=f"https://example.com/{i}",
                 title=f"Article {i}",
                 relevance_score=80,
                 reasoning=f"Reason {i}",
+                key_excerpt=None,
             )
             for i in range(15)  # More than MAX_ITEMS_PER_MESSAGE
         ]
@@ -379,26 +403,29 @@ class TestBuildBlocks:
 class TestSendSlack:
     """Tests for send_slack function."""
 
+    @pytest.fixture(autouse=True)
+    def _patch_client(
+        self, mock_slack_client: tuple[MagicMock, SimpleNamespace]
+    ) -> tuple[MagicMock, SimpleNamespace]:
+        """Patch the webhook client for every test so none can reach Slack."""
+        return mock_slack_client
+
     @pytest.mark.asyncio
     async def test_send_slack_success(
         self,
         sample_payload: DeliveryPayload,
-        mock_webhook_response: MagicMock,
+        mock_slack_client: tuple[MagicMock, SimpleNamespace],
     ) -> None:
         """Test successful message send."""
-        with patch("wintern.delivery.slack.AsyncWebhookClient") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client.send = AsyncMock(return_value=mock_webhook_response)
-            mock_client.retry_handlers = []
-            mock_client_class.return_value = mock_client
+        _, mock_client = mock_slack_client
 
-            result = await send_slack(
-                "https://hooks.slack.com/services/xxx",
-                sample_payload,
-            )
+        result = await send_slack(
+            "https://hooks.slack.com/services/xxx",
+            sample_payload,
+        )
 
-            assert result is True
-            mock_client.send.assert_called_once()
+        assert result is True
+        mock_client.send.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_send_slack_missing_url(
@@ -413,64 +440,50 @@ class TestSendSlack:
     async def test_send_slack_rate_limit(
         self,
         sample_payload: DeliveryPayload,
+        mock_webhook_response: SimpleNamespace,
     ) -> None:
         """Test rate limit handling."""
-        with patch("wintern.delivery.slack.AsyncWebhookClient") as mock_client_class:
-            mock_response = MagicMock()
-            mock_response.status_code = 429
-            mock_response.body = "rate_limited"
-
-            mock_client = MagicMock()
-            mock_client.send = AsyncMock(return_value=mock_response)
-            mock_client.retry_handlers = []
-            mock_client_class.return_value = mock_client
-
-            with pytest.raises(SlackRateLimitError):
-                await send_slack(
-                    "https://hooks.slack.com/services/xxx",
-                    sample_payload,
-                )
+        mock_webhook_response.status_code = 429
+        mock_webhook_response.body = "rate_limited"
+
+        with pytest.raises(SlackRateLimitError):
+            await send_slack(
+                "https://hooks.slack.com/services/xxx",
+                sample_payload,
+            )
 
     @pytest.mark.asyncio
     async def test_send_slack_error_response(
         self,
         sample_payload: DeliveryPayload,
+        mock_webhook_response: SimpleNamespace,
     ) -> None:
         """Test handling of error response."""
-        with patch("wintern.delivery.slack.AsyncWebhookClient") as mock_client_class:
-            mock_response = MagicMock()
-            mock_response.status_code = 400
-            mock_response.body = "invalid_payload"
-
-            mock_client = MagicMock()
-            mock_client.send = AsyncMock(return_value=mock_response)
-            mock_client.retry_handlers = []
-            mock_client_class.return_value = mock_client
-
-            with pytest.raises(SlackWebhookError) as exc_info:
-                await send_slack(
-                    "https://hooks.slack.com/services/xxx",
-                    sample_payload,
-                )
-            assert exc_info.value.status_code == 400
+        mock_webhook_response.status_code = 400
+        mock_webhook_response.body = "invalid_payload"
+
+        with pytest.raises(SlackWebhookError) as exc_info:
+            await send_slack(
+                "https://hooks.slack.com/services/xxx",
+                sample_payload,
+            )
+        assert exc_info.value.status_code == 400
 
     @pytest.mark.asyncio
     async def test_send_slack_network_error(
         self,
         sample_payload: DeliveryPayload,
+        mock_slack_client: tuple[MagicMock, SimpleNamespace],
     ) -> None:
         """Test that network errors are wrapped in SlackWebhookError."""
-        with patch("wintern.delivery.slack.AsyncWebhookClient") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client.send = AsyncMock(side_effect=ConnectionError("Network unreachable"))
-            mock_client.retry_handlers = []
-            mock_client_class.return_value = mock_client
+        _, mock_client = mock_slack_client
+        mock_client.send.side_effect = ConnectionError("Network unreachable")
 
-            with pytest.raises(SlackWebhookError, match="Network or client error"):
-                await send_slack(
-                    "https://hooks.slack.com/services/xxx",
-                    sample_payload,
-                )
+        with pytest.raises(SlackWebhookError, match="Network or client error"):
+            await send_slack(
+                "https://hooks.slack.com/services/xxx",
+                sample_payload,
+            )
 
 
 # -----------------------------------------------------------------------------
@@ -481,6 +494,13 @@ class TestSendSlack:
 class TestSlackDelivery:
     """Tests for SlackDelivery class."""
 
+    @pytest.fixture(autouse=True)
+    def _patch_client(
+        self, mock_slack_client: tuple[MagicMock, SimpleNamespace]
+    ) -> tuple[MagicMock, SimpleNamespace]:
+        """Patch the webhook client for every test so none can reach Slack."""
+        return mock_slack_client
+
     def test_channel_name(self) -> None:
         """Test that channel name is 'slack'."""
         delivery = SlackDelivery()
@@ -492,78 +512,62 @@ class TestSlackDelivery:
         delivery = SlackDelivery(webhook_url=custom_url)
         assert delivery.webhook_url == custom_url
 
-    def test_default_webhook_url(self) -> None:
+    def test_default_webhook_url(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test falling back to settings for webhook URL."""
-        with patch("wintern.delivery.slack.settings") as mock_settings:
-            mock_settings.slack_default_webhook_url = "https://hooks.slack.com/default"
-            delivery = SlackDelivery()
-            assert delivery.webhook_url == "https://hooks.slack.com/default"
+        monkeypatch.setattr(
+            slack.settings, "slack_default_webhook_url", "https://hooks.slack.com/default"
+        )
+        delivery = SlackDelivery()
+        assert delivery.webhook_url == "https://hooks.slack.com/default"
 
     @pytest.mark.asyncio
     async def test_deliver_success(
         self,
         sample_payload: DeliveryPayload,
-        mock_webhook_response: MagicMock,
     ) -> None:
         """Test successful delivery."""
-        with patch("wintern.delivery.slack.AsyncWebhookClient") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client.send = AsyncMock(return_value=mock_webhook_response)
-            mock_client.retry_handlers = []
-            mock_client_class.return_value = mock_client
-
-            delivery = SlackDelivery(webhook_url="https://hooks.slack.com/test")
-            result = await delivery.deliver(sample_payload)
+        delivery = SlackDelivery(webhook_url="https://hooks.slack.com/test")
+        result = await delivery.deliver(sample_payload)
 
-            assert isinstance(result, DeliveryResult)
-            assert result.success is True
-            assert result.channel == "slack"
-            assert result.error_message is None
+        assert isinstance(result, DeliveryResult)
+        assert result.success is True
+        assert result.channel == "slack"
+        assert result.error_message is None
 
     @pytest.mark.asyncio
     async def test_deliver_failure(
         self,
         sample_payload: DeliveryPayload,
+        mock_webhook_response: SimpleNamespace,
     ) -> None:
         """Test delivery failure handling."""
-        with patch("wintern.delivery.slack.AsyncWebhookClient") as mock_client_class:
-            mock_response = MagicMock()
-            mock_response.status_code = 500
-            mock_response.body = "server_error"
+        mock_webhook_response.status_code = 500
+        mock_webhook_response.body = "server_error"
 
-            mock_client = MagicMock()
-            mock_client.send = AsyncMock(return_value=mock_response)
-            mock_client.retry_handlers = []
-            mock_client_class.return_value = mock_client
-
-            delivery = SlackDelivery(webhook_url="https://hooks.slack.com/test")
-            result = await delivery.deliver(sample_payload)
+        delivery = SlackDelivery(webhook_url="https://hooks.slack.com/test")
+        result = await delivery.deliver(sample_payload)
 
-            assert result.success is False
-            assert result.channel == "slack"
-            assert result.error_message is not None
+        assert result.success is False
+        assert result.channel == "slack"
+        assert result.error_message is not None
 
     @pytest.mark.asyncio
     async def test_deliver_with_url_override(
         self,
         sample_payload: DeliveryPayload,
-        mock_webhook_response: MagicMock,
+        mock_slack_client: tuple[MagicMock, SimpleNamespace],
     ) -> None:
         """Test delivery with webhook URL override in kwargs."""
-        with patch("wintern.delivery.slack.AsyncWebhookClient") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client.send = AsyncMock(return_value=mock_webhook_response)
-            mock_client.retry_handlers = []
-            mock_client_class.return_value = mock_client
-
-            delivery = SlackDelivery(webhook_url="https://hooks.slack.com/default")
-            await delivery.deliver(
-                sample_payload,
-                webhook_url="https://hooks.slack.com/override",
-            )
+        mock_client_class, _ = mock_slack_client
 
-            # Verify the override URL was used
-            mock_client_class.assert_called_with(url="https://hooks.slack.com/override")
+        delivery = SlackDelivery(webhook_url="https://hooks.slack.com/default")
+        await delivery.deliver(
+            sample_payload,
+            webhook_url="https://hooks.slack.com/override",
+        )
+
+        # Verify the override URL was used
+        mock_client_class.assert_called_with(url="https://hooks.slack.com/override")
 
     @pytest.mark.asyncio
     async def test_deliver_unexpected_error(
@@ -589,13 +593,12 @@ class TestSlackDelivery:
         assert result is True
 
     @pytest.mark.asyncio
-    async def test_health_check_not_configured(self) -> None:
+    async def test_health_check_not_configured(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test health check when webhook is not configured."""
-        with patch("wintern.delivery.slack.settings") as mock_settings:
-            mock_settings.slack_default_webhook_url = ""
-            delivery = SlackDelivery()
-            result = await delivery.health_check()
-            assert result is False
+        monkeypatch.setattr(slack.settings, "slack_default_webhook_url", "")
+        delivery = SlackDelivery()
+        result = await delivery.health_check()
+        assert result is False
 
 
 # -----------------------------------------------------------------------------
@@ -1,26 +1,148 @@
 """Tests for Wintern CRUD endpoints."""
 
-import pytest
-from httpx import AsyncClient
-
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
 
-async def get_auth_token(client: AsyncClient, email: str = "wintern-test@example.com") -> str:
-    """Helper to register and login, returning the access token."""
-    await client.post(
-        "/auth/register",
-        json={"email": email, "password": "testpassword123"},
-    )
-    login_response = await client.post(
-        "/auth/login",
-        data={"username": email, "password": "testpassword123"},
-    )
-    return login_response.json()["access_token"]
+import pytest
+import pytest_asyncio
+from fastapi_users.password import PasswordHelper
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from wintern.auth.models import User
+from wintern.auth.service import get_jwt_strategy
+from wintern.main import app
+
+# Request bodies shared across tests; httpx only reads them
+_MINIMAL_PAYLOAD = {
+    "name": "Simple Wintern",
+    "context": "Just a simple research agent",
+}
+
+_FULL_PAYLOAD = {
+    "name": "AI News Digest",
+    "description": "Daily digest of AI news",
+    "context": "I want to stay updated on the latest AI research and industry news",
+    "cron_schedule": "0 9 * * *",
+    "source_configs": [
+        {
+            "source_type": "brave_search",
+            "config": {"query": "artificial intelligence news"},
+        }
+    ],
+    "delivery_configs": [
+        {
+            "delivery_type": "email",
+            "config": {"to": "user@example.com"},
+        }
+    ],
+}
+
+
+@pytest_asyncio.fixture(scope="module")
+async def client(module_client: AsyncClient) -> AsyncClient:
+    """Share one app client and database across this module's tests.
+
+    Each test uses its own user, so tests stay isolated by owner.
+    """
+    return module_client
+
+
+@pytest_asyncio.fixture(scope="module")
+async def auth_token_factory(module_engine: AsyncEngine) -> Callable[[str], Awaitable[str]]:
+    """Return a helper that creates a user and returns an access token for them.
+
+    Users are inserted straight into the module database with one password
+    hash computed up front, and the token is signed with the app's own JWT
+    strategy, so no test pays for registration, login or per-user hashing.
+    Tokens are cached by email for the lifetime of that database.
+    """
+    hashed_password = PasswordHelper().hash("testpassword123")
+    strategy = get_jwt_strategy()
+    tokens: dict[str, str] = {}
+
+    async def get_auth_token(email: str = "wintern-test@example.com") -> str:
+        if email not in tokens:
+            async with AsyncSession(module_engine, expire_on_commit=False) as session:
+                user = User(email=email, hashed_password=hashed_password)
+                session.add(user)
+                await session.commit()
+            tokens[email] = await strategy.write_token(user)
+        return tokens[email]
+
+    return get_auth_token
+
+
+@asynccontextmanager
+async def _client_for(token: str) -> AsyncIterator[AsyncClient]:
+    """Open a client on the app that sends token as its bearer credentials."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+        headers={"Authorization": f"Bearer {token}"},
+    ) as ac:
+        yield ac
+
+
+@pytest_asyncio.fixture(scope="module")
+async def authed_client(
+    client: AsyncClient, auth_token_factory: Callable[[str], Awaitable[str]]
+) -> AsyncIterator[AsyncClient]:
+    """Yield a client already authenticated as one shared module user.
+
+    For tests that only need "a logged-in user". Tests that check per-user
+    lists, counts or isolation use their own user instead.
+    """
+    async with _client_for(await auth_token_factory("authed@example.com")) as ac:
+        yield ac
+
+
+@pytest_asyncio.fixture(scope="module")
+async def seeded_client(
+    client: AsyncClient, auth_token_factory: Callable[[str], Awaitable[str]]
+) -> AsyncIterator[AsyncClient]:
+    """Yield a client for a user owning a fixed set of six winterns.
+
+    The listing tests only read this data, so it is seeded once per module:
+    2 active with schedules, 1 active without, 2 paused and 1 soft deleted
+    (both of which clear next_run_at).
+    """
+    async with _client_for(await auth_token_factory("seeded@example.com")) as ac:
+        payloads = [
+            *(
+                {
+                    "name": f"Active Scheduled {i}",
+                    "context": f"Context {i}",
+                    "cron_schedule": "0 9 * * *",
+                }
+                for i in range(2)
+            ),
+            {"name": "Active No Schedule", "context": "No schedule context"},
+            *(
+                {
+                    "name": f"To Pause {i}",
+                    "context": f"Will be paused {i}",
+                    "cron_schedule": "0 10 * * *",
+                }
+                for i in range(2)
+            ),
+            {"name": "To Delete", "context": "Will be deleted", "cron_schedule": "0 11 * * *"},
+        ]
+        # Sequential on purpose: the module's in-memory engine shares one
+        # connection, so one request's rollback-on-return could undo another's
+        # uncommitted insert if they ran concurrently
+        create_responses = [await ac.post("/v1/winterns", json=payload) for payload in payloads]
+        for response in create_responses[3:5]:
+            await ac.put(f"/v1/winterns/{response.json()['id']}", json={"is_active": False})
+        delete_response = await ac.delete(f"/v1/winterns/{create_responses[5].json()['id']}")
+        assert delete_response.status_code == 204
+        yield ac
 
 
 @pytest.mark.asyncio
-async def test_list_winterns_empty(client: AsyncClient):
+async def test_list_winterns_empty(client: AsyncClient, auth_token_factory):
     """Test listing Winterns when user has none."""
-    token = await get_auth_token(client, "list-empty@example.com")
+    token = await auth_token_factory("list-empty@example.com")
 
     response = await client.get(
         "/v1/winterns",
@@ -38,119 +160,81 @@ async def test_list_winterns_empty(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_create_wintern(client: AsyncClient):
-    """Test creating a new Wintern."""
-    token = await get_auth_token(client, "create@example.com")
-
-    response = await client.post(
-        "/v1/winterns",
-        headers={"Authorization": f"Bearer {token}"},
-        json={
-            "name": "AI News Digest",
-            "description": "Daily digest of AI news",
-            "context": "I want to stay updated on the latest AI research and industry news",
-            "cron_schedule": "0 9 * * *",
-            "source_configs": [
-                {
-                    "source_type": "brave_search",
-                    "config": {"query": "artificial intelligence news"},
-                }
-            ],
-            "delivery_configs": [
-                {
-                    "delivery_type": "email",
-                    "config": {"to": "user@example.com"},
-                }
-            ],
-        },
-    )
-    assert response.status_code == 201
-    data = response.json()
-    assert data["name"] == "AI News Digest"
-    assert data["description"] == "Daily digest of AI news"
-    assert data["is_active"] is True
-    assert len(data["source_configs"]) == 1
-    assert data["source_configs"][0]["source_type"] == "brave_search"
-    assert len(data["delivery_configs"]) == 1
-    assert data["delivery_configs"][0]["delivery_type"] == "email"
-
-
-@pytest.mark.asyncio
-async def test_create_wintern_minimal(client: AsyncClient):
-    """Test creating a Wintern with minimal required fields."""
-    token = await get_auth_token(client, "minimal@example.com")
-
-    response = await client.post(
-        "/v1/winterns",
-        headers={"Authorization": f"Bearer {token}"},
-        json={
-            "name": "Simple Wintern",
-            "context": "Just a simple research agent",
-        },
-    )
+@pytest.mark.parametrize(
+    ("payload", "expected"),
+    [
+        pytest.param(
+            _FULL_PAYLOAD,
+            {
+                "name": "AI News Digest",
+                "description": "Daily digest of AI news",
+                "is_active": True,
+                "source_types": ["brave_search"],
+                "delivery_types": ["email"],
+            },
+            id="full",
+        ),
+        pytest.param(
+            _MINIMAL_PAYLOAD,
+            {
+                "name": "Simple Wintern",
+                "description": None,
+                "is_active": True,
+                "source_types": [],
+                "delivery_types": [],
+            },
+            id="minimal",
+        ),
+    ],
+)
+async def test_create_wintern(authed_client: AsyncClient, payload: dict, expected: dict):
+    """Test creating a Wintern, with every field and with only the required ones."""
+    response = await authed_client.post("/v1/winterns", json=payload)
     assert response.status_code == 201
     data = response.json()
-    assert data["name"] == "Simple Wintern"
-    assert data["source_configs"] == []
-    assert data["delivery_configs"] == []
+    assert data["name"] == expected["name"]
+    assert data["description"] == expected["description"]
+    assert data["is_active"] is expected["is_active"]
+    assert [c["source_type"] for c in data["source_configs"]] == expected["source_types"]
+    assert [c["delivery_type"] for c in data["delivery_configs"]] == expected["delivery_types"]
 
 
 @pytest.mark.asyncio
-async def test_get_wintern(client: AsyncClient):
+async def test_get_wintern(authed_client: AsyncClient):
     """Test getting a single Wintern."""
-    token = await get_auth_token(client, "get@example.com")
-
     # Create a wintern first
-    create_response = await client.post(
-        "/v1/winterns",
-        headers={"Authorization": f"Bearer {token}"},
-        json={
-            "name": "Test Wintern",
-            "context": "Test context",
-        },
-    )
+    create_response = await authed_client.post("/v1/winterns", json=_MINIMAL_PAYLOAD)
     wintern_id = create_response.json()["id"]
 
     # Get the wintern
-    response = await client.get(
-        f"/v1/winterns/{wintern_id}",
-        headers={"Authorization": f"Bearer {token}"},
-    )
+    response = await authed_client.get(f"/v1/winterns/{wintern_id}")
     assert response.status_code == 200
     data = response.json()
     assert data["id"] == wintern_id
-    assert data["name"] == "Test Wintern"
+    assert data["name"] == _MINIMAL_PAYLOAD["name"]
 
 
 @pytest.mark.asyncio
-async def test_get_wintern_not_found(client: AsyncClient):
+async def test_get_wintern_not_found(authed_client: AsyncClient):
     """Test getting a non-existent Wintern returns 404."""
-    token = await get_auth_token(client, "notfound@example.com")
-
-    response = await client.get(
-        "/v1/winterns/00000000-0000-0000-0000-000000000000",
-        headers={"Authorization": f"Bearer {token}"},
-    )
+    response = await authed_client.get("/v1/winterns/00000000-0000-0000-0000-000000000000")
     assert response.status_code == 404
 
 
 @pytest.mark.asyncio
-async def test_get_wintern_other_user(client: AsyncClient):
+async def test_get_wintern_other_user(client: AsyncClient, auth_token_factory):
     """Test that users cannot access other users' Winterns."""
     # Create wintern as user 1
-    token1 = await get_auth_token(client, "user1@example.com")
+    token1 = await auth_token_factory("user1@example.com")
     create_response = await client.post(
         "/v1/winterns",
         headers={"Authorization": f"Bearer {token1}"},
-        json={
-            "name": "User 1 Wintern",
-            "context": "User 1 context",
-        },
+        json=_MINIMAL_PAYLOAD,
     )
     wintern_id = create_response.json()["id"]
 
     # Try to access as user 2
-    token2 = await get_auth_token(client, "user2@example.com")
+    token2 = await auth_token_factory("user2@example.com")
     response = await client.get(
         f"/v1/winterns/{wintern_id}",
         headers={"Authorization": f"Bearer {token2}"},
@@ -159,25 +243,15 @@ async def test_get_wintern_other_user(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_update_wintern(client: AsyncClient):
+async def test_update_wintern(authed_client: AsyncClient):
     """Test updating a Wintern."""
-    token = await get_auth_token(client, "update@example.com")
-
     # Create a wintern
-    create_response = await client.post(
-        "/v1/winterns",
-        headers={"Authorization": f"Bearer {token}"},
-        json={
-            "name": "Original Name",
-            "context": "Original context",
-        },
-    )
+    create_response = await authed_client.post("/v1/winterns", json=_MINIMAL_PAYLOAD)
     wintern_id = create_response.json()["id"]
 
     # Update the wintern
-    response = await client.put(
+    response = await authed_client.put(
         f"/v1/winterns/{wintern_id}",
-        headers={"Authorization": f"Bearer {token}"},
         json={
             "name": "Updated Name",
             "description": "New description",
@@ -187,23 +261,16 @@ async def test_update_wintern(client: AsyncClient):
     data = response.json()
     assert data["name"] == "Updated Name"
     assert data["description"] == "New description"
-    assert data["context"] == "Original context"  # Unchanged
+    assert data["context"] == _MINIMAL_PAYLOAD["context"]  # Unchanged
 
 
 @pytest.mark.asyncio
-async def test_update_wintern_preserves_next_run_at(client: AsyncClient):
+async def test_update_wintern_preserves_next_run_at(authed_client: AsyncClient):
     """Test that updating unrelated fields doesn't affect next_run_at."""
-    token = await get_auth_token(client, "update-schedule@example.com")
-
     # Create a scheduled wintern
-    create_response = await client.post(
+    create_response = await authed_client.post(
         "/v1/winterns",
-        headers={"Authorization": f"Bearer {token}"},
-        json={
-            "name": "Scheduled Wintern",
-            "context": "Test context",
-            "cron_schedule": "0 9 * * *",
-        },
+        json={**_MINIMAL_PAYLOAD, "cron_schedule": "0 9 * * *"},
     )
     assert create_response.status_code == 201
     wintern_id = create_response.json()["id"]
@@ -211,9 +278,8 @@ async def test_update_wintern_preserves_next_run_at(client: AsyncClient):
     assert original_next_run_at is not None
 
     # Update only name/description - should NOT affect next_run_at
-    response = await client.put(
+    response = await authed_client.put(
         f"/v1/winterns/{wintern_id}",
-        headers={"Authorization": f"Bearer {token}"},
         json={
             "name": "Renamed Wintern",
             "description": "Added description",
@@ -226,137 +292,49 @@ async def test_update_wintern_preserves_next_run_at(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_delete_wintern(client: AsyncClient):
-    """Test soft deleting a Wintern."""
-    token = await get_auth_token(client, "delete@example.com")
-
-    # Create a wintern
-    create_response = await client.post(
-        "/v1/winterns",
-        headers={"Authorization": f"Bearer {token}"},
-        json={
-            "name": "To Delete",
-            "context": "Will be deleted",
-        },
-    )
-    wintern_id = create_response.json()["id"]
-
-    # Delete the wintern
-    response = await client.delete(
-        f"/v1/winterns/{wintern_id}",
-        headers={"Authorization": f"Bearer {token}"},
-    )
-    assert response.status_code == 204
-
-    # Verify it's soft deleted (still accessible but is_active=False)
-    get_response = await client.get(
-        f"/v1/winterns/{wintern_id}",
-        headers={"Authorization": f"Bearer {token}"},
-    )
-    assert get_response.status_code == 200
-    assert get_response.json()["is_active"] is False
-
-
-@pytest.mark.asyncio
-async def test_list_winterns_pagination(client: AsyncClient):
+async def test_list_winterns_pagination(seeded_client: AsyncClient):
     """Test listing Winterns with pagination."""
-    token = await get_auth_token(client, "pagination@example.com")
-
-    # Create 5 winterns
-    for i in range(5):
-        await client.post(
-            "/v1/winterns",
-            headers={"Authorization": f"Bearer {token}"},
-            json={
-                "name": f"Wintern {i}",
-                "context": f"Context {i}",
-            },
-        )
-
-    # Get first page
-    response = await client.get(
-        "/v1/winterns?skip=0&limit=2",
-        headers={"Authorization": f"Bearer {token}"},
-    )
+    # Get every wintern in one page
+    response = await seeded_client.get("/v1/winterns?limit=6")
     assert response.status_code == 200
     data = response.json()
-    assert len(data["items"]) == 2
-    assert data["total"] == 5
+    assert len(data["items"]) == 6
+    assert data["total"] == 6
     assert data["skip"] == 0
-    assert data["limit"] == 2
+    assert data["limit"] == 6
+    all_items = data["items"]
 
-    # Get second page
-    response = await client.get(
-        "/v1/winterns?skip=2&limit=2",
-        headers={"Authorization": f"Bearer {token}"},
-    )
+    # A middle page should be the matching slice of the full listing
+    response = await seeded_client.get("/v1/winterns?skip=2&limit=2")
+    assert response.status_code == 200
     data = response.json()
-    assert len(data["items"]) == 2
+    assert data["items"] == all_items[2:4]
+    assert data["total"] == 6
     assert data["skip"] == 2
+    assert data["limit"] == 2
 
 
 @pytest.mark.asyncio
-async def test_list_winterns_aggregate_counts(client: AsyncClient):
-    """Test that aggregate counts are returned correctly across all winterns."""
-    token = await get_auth_token(client, "counts@example.com")
-
-    # Create 2 active winterns with schedules (will have next_run_at set)
-    for i in range(2):
-        await client.post(
-            "/v1/winterns",
-            headers={"Authorization": f"Bearer {token}"},
-            json={
-                "name": f"Active Scheduled {i}",
-                "context": f"Context {i}",
-                "cron_schedule": "0 9 * * *",
-            },
-        )
-
-    # Create 1 active wintern without schedule
-    await client.post(
-        "/v1/winterns",
-        headers={"Authorization": f"Bearer {token}"},
-        json={
-            "name": "Active No Schedule",
-            "context": "No schedule context",
-        },
-    )
-
-    # Create 2 winterns with schedules and pause them (next_run_at should be cleared)
-    for i in range(2):
-        create_response = await client.post(
-            "/v1/winterns",
-            headers={"Authorization": f"Bearer {token}"},
-            json={
-                "name": f"To Pause {i}",
-                "context": f"Will be paused {i}",
-                "cron_schedule": "0 10 * * *",
-            },
-        )
-        wintern_id = create_response.json()["id"]
-        # Pause by setting is_active=False - should clear next_run_at
-        await client.put(
-            f"/v1/winterns/{wintern_id}",
-            headers={"Authorization": f"Bearer {token}"},
-            json={"is_active": False},
-        )
+async def test_list_winterns_aggregate_counts(seeded_client: AsyncClient):
+    """Test that aggregate counts are returned correctly across all winterns.
 
+    Also covers soft delete: the deleted wintern is still listed, counts as
+    paused and no longer counts as scheduled.
+    """
     # List winterns with small page size to test counts are across all, not just page
-    response = await client.get(
-        "/v1/winterns?limit=2",
-        headers={"Authorization": f"Bearer {token}"},
-    )
+    response = await seeded_client.get("/v1/winterns?limit=2")
     assert response.status_code == 200
     data = response.json()
 
     # Verify pagination returns only 2 items
     assert len(data["items"]) == 2
-    assert data["total"] == 5
+    assert data["total"] == 6
 
-    # Counts should reflect all 5 winterns
+    # Counts should reflect all 6 winterns
     assert data["active_count"] == 3
-    assert data["paused_count"] == 2
-    # Only the 2 active scheduled winterns should be counted (paused ones have next_run_at cleared)
+    assert data["paused_count"] == 3
+    # Only the 2 active scheduled winterns should be counted
+    # (paused and deleted ones have next_run_at cleared)
     assert data["scheduled_count"] == 2
 
 